@@ -25,7 +25,6 @@
 
 # Python module imports.
 from copy import deepcopy
-from re import search
 
 
 class Prototype(object):
@@ -37,19 +36,19 @@ class Prototype(object):
         # Make a new object.
         new_obj = self.__class__.__new__(self.__class__)
 
-        # Loop over all objects in self and make deepcopies of them.
-        for name in dir(self):
+        # The class methods.
+        class_names = self.__class__.__dict__
+
+        # Loop over all objects in the instance namespace and make deepcopies of them (the class and inherited methods are not present in the instance dictionary).
+        for name, value in list(self.__dict__.items()):
             # Skip all names begining with '__'.
-            if search('^__', name):
+            if name[:2] == '__':
                 continue
 
             # Skip the class methods.
-            if name in list(self.__class__.__dict__.keys()):
+            if name in class_names:
                 continue
 
-            # Get the object.
-            value = getattr(self, name)
-
             # Replace the object with a deepcopy of it.
             setattr(new_obj, name, deepcopy(value, memo))
 
@@ -909,19 +909,22 @@ def is_str_list(arg, name=None, size=None, can_be_none=False, can_be_empty=False
         if not can_be_empty and arg == []:
             fail = True
 
-        # Fail if not strings.
-        for i in range(len(arg)):
+        # Fail if not strings (stopping at the first failure).
+        for element in arg:
             # List of lists.
-            if list_of_lists and isinstance(arg[i], list):
-                for j in range(len(arg[i])):
-                    if not isinstance(arg[i][j], str):
+            if list_of_lists and isinstance(element, list):
+                for sub_element in element:
+                    if not isinstance(sub_element, str):
                         fail = True
-
+                        break
 
             # Simple list.
-            else:
-                if not isinstance(arg[i], str):
-                    fail = True
+            elif not isinstance(element, str):
+                fail = True
+
+            # No need to check further.
+            if fail:
+                break
 
     # Fail.
     if fail:
@@ -373,7 +373,7 @@ def open_read_file(file_name=None, dir=None, verbosity=1):
     return file_obj
 
 
-def open_write_file(file_name=None, dir=None, force=False, compress_type=0, verbosity=1, return_path=False):
+def open_write_file(file_name=None, dir=None, force=False, compress_type=0, verbosity=1, return_path=False, buffer_size=-1):
     """Function for opening a file for writing and creating directories if necessary.
 
     @param file_name:       The name of the file to extract the data from.
@@ -392,6 +392,9 @@ def open_write_file(file_name=None, dir=None, force=False, compress_type=0, verb
     @param return_path:     If True, the function will return a tuple of the file object and the
                             full file path.
     @type return_path:      bool
+    @param buffer_size:     The size of the write buffer in bytes for uncompressed files.  The default
+                            of -1 uses the system default buffering.
+    @type buffer_size:      int
     @return:                The open, writable file object and, if the return_path is True, then the
                             full file path is returned as well.
     @rtype:                 writable file object (if return_path, then a tuple of the writable file
@@ -419,7 +422,7 @@ def open_write_file(file_name=None, dir=None, force=False, compress_type=0, verb
             print("Opening the null device file for writing.")
 
         # Open the null device.
-        file_obj = open(devnull, 'w')
+        file_obj = open(devnull, 'w', buffer_size)
 
         # Return the file.
         if return_path:
@@ -460,7 +463,7 @@ def open_write_file(file_name=None, dir=None, force=False, compress_type=0, verb
 
         # Uncompressed text.
         if compress_type == 0:
-            file_obj = open(file_path, 'w')
+            file_obj = open(file_path, 'w', buffer_size)
 
         # Bzip2 compressed text.
         elif compress_type == 1:
@@ -166,6 +166,15 @@ g17O = -3.628 * 1e7
 g31P = 10.841 * 1e7
 """The 31P gyromagnetic ratio."""
 
+_gyromagnetic_ratios = {
+    '13C': g13C,
+    '1H':  g1H,
+    '15N': g15N,
+    '17O': g17O,
+    '31P': g31P
+}
+"""The look up table of gyromagnetic ratios, keyed by nucleus type."""
+
 # Function for returning the desired gyromagnetic ratio.
 def return_gyromagnetic_ratio(nucleus=None):
     """Return the gyromagnetic ratio for the given nucleus type.
@@ -177,18 +186,12 @@ def return_gyromagnetic_ratio(nucleus=None):
     @rtype:             float
     """
 
-    # Matching loop.
-    if nucleus == '13C':
-        return g13C
-    elif nucleus == '1H':
-        return g1H
-    elif nucleus == '15N':
-        return g15N
-    elif nucleus == '17O':
-        return g17O
-    elif nucleus == '31P':
-        return g31P
-    else:
+    # Table look up.
+    try:
+        return _gyromagnetic_ratios[nucleus]
+
+    # Unknown nucleus.
+    except (KeyError, TypeError):
         raise RelaxError("The nucleus type " + repr(nucleus) + " is unknown.")
 
 
@@ -25,7 +25,7 @@
 # Python module imports.
 from copy import deepcopy
 from math import pi, sqrt
-from numpy import arccos, dot, float64, linalg, zeros
+from numpy import arccos, array, dot, float64, linalg, zeros
 from numpy.linalg import norm
 from re import search
 import sys
@@ -42,6 +42,75 @@ from pipe_control import pipes
 from pipe_control.angles import wrap_angles
 
 
+# The conversion of the 5 geometric parameter sets to the internal {Axx, Ayy, Axy, Axz, Ayz} parameters.
+# Each parameter set signature maps to the parameter ordering, and the matrix and offset of the linear transformation A = M.v + c.
+_GEO_MAPS = {
+    frozenset(['Sxx', 'Syy', 'Sxy', 'Sxz', 'Syz']): (
+        ('Sxx', 'Syy', 'Sxy', 'Sxz', 'Syz'),
+        array([[2.0/3.0,     0.0,     0.0,     0.0,     0.0],
+               [    0.0, 2.0/3.0,     0.0,     0.0,     0.0],
+               [    0.0,     0.0, 2.0/3.0,     0.0,     0.0],
+               [    0.0,     0.0,     0.0, 2.0/3.0,     0.0],
+               [    0.0,     0.0,     0.0,     0.0, 2.0/3.0]], float64),
+        zeros(5, float64)
+    ),
+    frozenset(['Szz', 'Sxxyy', 'Sxy', 'Sxz', 'Syz']): (
+        ('Szz', 'Sxxyy', 'Sxy', 'Sxz', 'Syz'),
+        array([[-1.0/3.0,  1.0/3.0,     0.0,     0.0,     0.0],
+               [-1.0/3.0, -1.0/3.0,     0.0,     0.0,     0.0],
+               [     0.0,      0.0, 2.0/3.0,     0.0,     0.0],
+               [     0.0,      0.0,     0.0, 2.0/3.0,     0.0],
+               [     0.0,      0.0,     0.0,     0.0, 2.0/3.0]], float64),
+        zeros(5, float64)
+    ),
+    frozenset(['Axx', 'Ayy', 'Axy', 'Axz', 'Ayz']): (
+        ('Axx', 'Ayy', 'Axy', 'Axz', 'Ayz'),
+        array([[1.0, 0.0, 0.0, 0.0, 0.0],
+               [0.0, 1.0, 0.0, 0.0, 0.0],
+               [0.0, 0.0, 1.0, 0.0, 0.0],
+               [0.0, 0.0, 0.0, 1.0, 0.0],
+               [0.0, 0.0, 0.0, 0.0, 1.0]], float64),
+        zeros(5, float64)
+    ),
+    frozenset(['Azz', 'Axxyy', 'Axy', 'Axz', 'Ayz']): (
+        ('Azz', 'Axxyy', 'Axy', 'Axz', 'Ayz'),
+        array([[-0.5,  0.5, 0.0, 0.0, 0.0],
+               [-0.5, -0.5, 0.0, 0.0, 0.0],
+               [ 0.0,  0.0, 1.0, 0.0, 0.0],
+               [ 0.0,  0.0, 0.0, 1.0, 0.0],
+               [ 0.0,  0.0, 0.0, 0.0, 1.0]], float64),
+        zeros(5, float64)
+    ),
+    frozenset(['Pxx', 'Pyy', 'Pxy', 'Pxz', 'Pyz']): (
+        ('Pxx', 'Pyy', 'Pxy', 'Pxz', 'Pyz'),
+        array([[1.0, 0.0, 0.0, 0.0, 0.0],
+               [0.0, 1.0, 0.0, 0.0, 0.0],
+               [0.0, 0.0, 1.0, 0.0, 0.0],
+               [0.0, 0.0, 0.0, 1.0, 0.0],
+               [0.0, 0.0, 0.0, 0.0, 1.0]], float64),
+        array([-1.0/3.0, -1.0/3.0, 0.0, 0.0, 0.0], float64)
+    ),
+    frozenset(['Pzz', 'Pxxyy', 'Pxy', 'Pxz', 'Pyz']): (
+        ('Pzz', 'Pxxyy', 'Pxy', 'Pxz', 'Pyz'),
+        array([[-0.5,  0.5, 0.0, 0.0, 0.0],
+               [-0.5, -0.5, 0.0, 0.0, 0.0],
+               [ 0.0,  0.0, 1.0, 0.0, 0.0],
+               [ 0.0,  0.0, 0.0, 1.0, 0.0],
+               [ 0.0,  0.0, 0.0, 0.0, 1.0]], float64),
+        array([-1.0/3.0, -1.0/3.0, 0.0, 0.0, 0.0], float64)
+    )
+}
+
+# The internal geometric parameters, in the order of the _GEO_MAPS transformations.
+_GEO_INTERNAL = ['Axx', 'Ayy', 'Axy', 'Axz', 'Ayz']
+
+# All geometric parameter sets which can be set, including the single parameters.
+_GEO_SIGNATURES = set(_GEO_MAPS.keys())
+for _name in ['Sxx', 'Syy', 'Sxy', 'Sxz', 'Syz', 'Axx', 'Ayy', 'Axy', 'Axz', 'Ayz', 'Pxx', 'Pyy', 'Pxy', 'Pxz', 'Pyz']:
+    _GEO_SIGNATURES.add(frozenset([_name]))
+del _name
+
+
 def align_data_exists(tensor, pipe=None):
     """Function for determining if alignment data exists in the current data pipe.
 
@@ -1163,6 +1232,38 @@ def num_tensors(skip_fixed=True):
     return count
 
 
+def opt_tensor_indices():
+    """Determine the indices of all alignment tensors which are to be optimised.
+
+    This is equivalent to calling opt_uses_tensor() for each tensor, but with the RDC and PCS alignment IDs combined only once.
+
+
+    @return:    The indices of the optimised tensors in the cdp.align_tensors list.
+    @rtype:     list of int
+    """
+
+    # No tensors.
+    if not hasattr(cdp, 'align_tensors'):
+        return []
+
+    # Combine all RDC and PCS IDs.
+    ids = set()
+    if hasattr(cdp, 'rdc_ids'):
+        ids.update(cdp.rdc_ids)
+    if hasattr(cdp, 'pcs_ids'):
+        ids.update(cdp.pcs_ids)
+
+    # The non-fixed tensors with RDC or PCS data.
+    indices = []
+    for i in range(len(cdp.align_tensors)):
+        tensor = cdp.align_tensors[i]
+        if tensor.align_id in ids and not tensor.fixed:
+            indices.append(i)
+
+    # Return the indices.
+    return indices
+
+
 def opt_uses_align_data(align_id=None):
     """Determine if the PCS or RDC data for the given alignment ID is needed for optimisation.
 
@@ -1549,6 +1650,14 @@ def set(tensor=None, value=None, param=None, errors=False):
             orient_params.append(param[i])
             orient_values.append(value[i])
 
+    # Validate the parameter sets once, up front.
+    sig = frozenset(geo_params)
+    if len(geo_params) == 1 and sig not in _GEO_SIGNATURES:
+        raise RelaxError("The geometric alignment parameter " + repr(geo_params[0]) + " cannot be set.")
+    if geo_params and (len(sig) != len(geo_params) or sig not in _GEO_SIGNATURES):
+        raise RelaxUnknownParamCombError('geometric parameter set', geo_params)
+    if len(frozenset(orient_params)) != len(orient_params):
+        raise RelaxUnknownParamCombError('orientational parameter set', orient_params)
 
     # Geometric parameters.
     #######################
@@ -1671,239 +1780,81 @@ def set(tensor=None, value=None, param=None, errors=False):
             else:
                 tensor.set(param='Syz', value=3.0/2.0 * geo_values[0])
 
-        # Cannot set the single parameter.
-        else:
-            raise RelaxError("The geometric alignment parameter " + repr(geo_params[0]) + " cannot be set.")
-
     # 5 geometric parameters.
     elif len(geo_params) == 5:
-        # The geometric parameter set {Sxx, Syy, Sxy, Sxz, Syz}.
-        if geo_params.count('Sxx') == 1 and geo_params.count('Syy') == 1 and geo_params.count('Sxy') == 1 and geo_params.count('Sxz') == 1 and geo_params.count('Syz') == 1:
-            # The parameters.
-            Sxx = geo_values[geo_params.index('Sxx')]
-            Syy = geo_values[geo_params.index('Syy')]
-            Sxy = geo_values[geo_params.index('Sxy')]
-            Sxz = geo_values[geo_params.index('Sxz')]
-            Syz = geo_values[geo_params.index('Syz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=2.0/3.0 * Sxx, category='err')
-                tensor.set(param='Ayy', value=2.0/3.0 * Syy, category='err')
-                tensor.set(param='Axy', value=2.0/3.0 * Sxy, category='err')
-                tensor.set(param='Axz', value=2.0/3.0 * Sxz, category='err')
-                tensor.set(param='Ayz', value=2.0/3.0 * Syz, category='err')
-            else:
-                tensor.set(param='Axx', value=2.0/3.0 * Sxx)
-                tensor.set(param='Ayy', value=2.0/3.0 * Syy)
-                tensor.set(param='Axy', value=2.0/3.0 * Sxy)
-                tensor.set(param='Axz', value=2.0/3.0 * Sxz)
-                tensor.set(param='Ayz', value=2.0/3.0 * Syz)
-
-        # The geometric parameter set {Szz, Sxxyy, Sxy, Sxz, Syz}.
-        elif geo_params.count('Szz') == 1 and geo_params.count('Sxxyy') == 1 and geo_params.count('Sxy') == 1 and geo_params.count('Sxz') == 1 and geo_params.count('Syz') == 1:
-            # The parameters.
-            Szz = geo_values[geo_params.index('Szz')]
-            Sxxyy = geo_values[geo_params.index('Sxxyy')]
-            Sxy = geo_values[geo_params.index('Sxy')]
-            Sxz = geo_values[geo_params.index('Sxz')]
-            Syz = geo_values[geo_params.index('Syz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=2.0/3.0 * -0.5*(Szz-Sxxyy), category='err')
-                tensor.set(param='Ayy', value=2.0/3.0 * -0.5*(Szz+Sxxyy), category='err')
-                tensor.set(param='Axy', value=2.0/3.0 * Sxy, category='err')
-                tensor.set(param='Axz', value=2.0/3.0 * Sxz, category='err')
-                tensor.set(param='Ayz', value=2.0/3.0 * Syz, category='err')
-            else:
-                tensor.set(param='Axx', value=2.0/3.0 * -0.5*(Szz-Sxxyy))
-                tensor.set(param='Ayy', value=2.0/3.0 * -0.5*(Szz+Sxxyy))
-                tensor.set(param='Axy', value=2.0/3.0 * Sxy)
-                tensor.set(param='Axz', value=2.0/3.0 * Sxz)
-                tensor.set(param='Ayz', value=2.0/3.0 * Syz)
-
-        # The geometric parameter set {Axx, Ayy, Axy, Axz, Ayz}.
-        elif geo_params.count('Axx') == 1 and geo_params.count('Ayy') == 1 and geo_params.count('Axy') == 1 and geo_params.count('Axz') == 1 and geo_params.count('Ayz') == 1:
-            # The parameters.
-            Axx = geo_values[geo_params.index('Axx')]
-            Ayy = geo_values[geo_params.index('Ayy')]
-            Axy = geo_values[geo_params.index('Axy')]
-            Axz = geo_values[geo_params.index('Axz')]
-            Ayz = geo_values[geo_params.index('Ayz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=Axx, category='err')
-                tensor.set(param='Ayy', value=Ayy, category='err')
-                tensor.set(param='Axy', value=Axy, category='err')
-                tensor.set(param='Axz', value=Axz, category='err')
-                tensor.set(param='Ayz', value=Ayz, category='err')
-            else:
-                tensor.set(param='Axx', value=Axx)
-                tensor.set(param='Ayy', value=Ayy)
-                tensor.set(param='Axy', value=Axy)
-                tensor.set(param='Axz', value=Axz)
-                tensor.set(param='Ayz', value=Ayz)
-
-        # The geometric parameter set {Azz, Axxyy, Axy, Axz, Ayz}.
-        elif geo_params.count('Azz') == 1 and geo_params.count('Axxyy') == 1 and geo_params.count('Axy') == 1 and geo_params.count('Axz') == 1 and geo_params.count('Ayz') == 1:
-            # The parameters.
-            Azz = geo_values[geo_params.index('Azz')]
-            Axxyy = geo_values[geo_params.index('Axxyy')]
-            Axy = geo_values[geo_params.index('Axy')]
-            Axz = geo_values[geo_params.index('Axz')]
-            Ayz = geo_values[geo_params.index('Ayz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=-0.5*(Azz-Axxyy), category='err')
-                tensor.set(param='Ayy', value=-0.5*(Azz+Axxyy), category='err')
-                tensor.set(param='Axy', value=Axy, category='err')
-                tensor.set(param='Axz', value=Axz, category='err')
-                tensor.set(param='Ayz', value=Ayz, category='err')
-            else:
-                tensor.set(param='Axx', value=-0.5*(Azz-Axxyy))
-                tensor.set(param='Ayy', value=-0.5*(Azz+Axxyy))
-                tensor.set(param='Axy', value=Axy)
-                tensor.set(param='Axz', value=Axz)
-                tensor.set(param='Ayz', value=Ayz)
-
-        # The geometric parameter set {Pxx, Pyy, Pxy, Pxz, Pyz}.
-        elif geo_params.count('Pxx') == 1 and geo_params.count('Pyy') == 1 and geo_params.count('Pxy') == 1 and geo_params.count('Pxz') == 1 and geo_params.count('Pyz') == 1:
-            # The parameters.
-            Pxx = geo_values[geo_params.index('Pxx')]
-            Pyy = geo_values[geo_params.index('Pyy')]
-            Pxy = geo_values[geo_params.index('Pxy')]
-            Pxz = geo_values[geo_params.index('Pxz')]
-            Pyz = geo_values[geo_params.index('Pyz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=Pxx - 1.0/3.0, category='err')
-                tensor.set(param='Ayy', value=Pyy - 1.0/3.0, category='err')
-                tensor.set(param='Axy', value=Pxy, category='err')
-                tensor.set(param='Axz', value=Pxz, category='err')
-                tensor.set(param='Ayz', value=Pyz, category='err')
-            else:
-                tensor.set(param='Axx', value=Pxx - 1.0/3.0)
-                tensor.set(param='Ayy', value=Pyy - 1.0/3.0)
-                tensor.set(param='Axy', value=Pxy)
-                tensor.set(param='Axz', value=Pxz)
-                tensor.set(param='Ayz', value=Pyz)
-
-        # The geometric parameter set {Pzz, Pxxyy, Pxy, Pxz, Pyz}.
-        elif geo_params.count('Pzz') == 1 and geo_params.count('Pxxyy') == 1 and geo_params.count('Pxy') == 1 and geo_params.count('Pxz') == 1 and geo_params.count('Pyz') == 1:
-            # The parameters.
-            Pzz = geo_values[geo_params.index('Pzz')]
-            Pxxyy = geo_values[geo_params.index('Pxxyy')]
-            Pxy = geo_values[geo_params.index('Pxy')]
-            Pxz = geo_values[geo_params.index('Pxz')]
-            Pyz = geo_values[geo_params.index('Pyz')]
-
-            # Set the internal parameter values.
-            if errors:
-                tensor.set(param='Axx', value=-0.5*(Pzz-Pxxyy) - 1.0/3.0, category='err')
-                tensor.set(param='Ayy', value=-0.5*(Pzz+Pxxyy) - 1.0/3.0, category='err')
-                tensor.set(param='Axy', value=Pxy, category='err')
-                tensor.set(param='Axz', value=Pxz, category='err')
-                tensor.set(param='Ayz', value=Pyz, category='err')
-            else:
-                tensor.set(param='Axx', value=-0.5*(Pzz-Pxxyy) - 1.0/3.0)
-                tensor.set(param='Ayy', value=-0.5*(Pzz+Pxxyy) - 1.0/3.0)
-                tensor.set(param='Axy', value=Pxy)
-                tensor.set(param='Axz', value=Pxz)
-                tensor.set(param='Ayz', value=Pyz)
-
-        # Unknown parameter combination.
-        else:
-            raise RelaxUnknownParamCombError('geometric parameter set', geo_params)
+        set_batch(tensor=tensor, params=geo_params, values=geo_values, errors=errors)
 
 
-    # Unknown geometric parameters.
-    else:
-        raise RelaxUnknownParamCombError('geometric parameter set', geo_params)
-
 
     # Orientational parameters.
     ###########################
 
+    # The orientational parameter values, keyed by name.
+    orient_vals = dict(zip(orient_params, orient_values))
+
     # A single orientational parameter.
     if len(orient_params) == 1:
         # The single parameter alpha.
         if orient_params[0] == 'alpha':
             if errors:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')], category='err')
+                tensor.set(param='alpha', value=orient_vals['alpha'], category='err')
             else:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')])
+                tensor.set(param='alpha', value=orient_vals['alpha'])
 
         # The single parameter beta.
         elif orient_params[0] == 'beta':
             if errors:
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')], category='err')
+                tensor.set(param='beta', value=orient_vals['beta'], category='err')
             else:
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')])
+                tensor.set(param='beta', value=orient_vals['beta'])
 
         # The single parameter gamma.
         elif orient_params[0] == 'gamma':
             if errors:
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')], category='err')
+                tensor.set(param='gamma', value=orient_vals['gamma'], category='err')
             else:
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')])
+                tensor.set(param='gamma', value=orient_vals['gamma'])
 
     # Two orientational parameters.
     elif len(orient_params) == 2:
         # The orientational parameter set {alpha, beta}.
-        if orient_params.count('alpha') == 1 and orient_params.count('beta') == 1:
+        if 'alpha' in orient_vals and 'beta' in orient_vals:
             if errors:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')], category='err')
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')], category='err')
+                tensor.set(param='alpha', value=orient_vals['alpha'], category='err')
+                tensor.set(param='beta', value=orient_vals['beta'], category='err')
             else:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')])
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')])
+                tensor.set(param='alpha', value=orient_vals['alpha'])
+                tensor.set(param='beta', value=orient_vals['beta'])
 
         # The orientational parameter set {alpha, gamma}.
-        if orient_params.count('alpha') == 1 and orient_params.count('gamma') == 1:
+        elif 'alpha' in orient_vals and 'gamma' in orient_vals:
             if errors:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')], category='err')
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')], category='err')
+                tensor.set(param='alpha', value=orient_vals['alpha'], category='err')
+                tensor.set(param='gamma', value=orient_vals['gamma'], category='err')
             else:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')])
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')])
+                tensor.set(param='alpha', value=orient_vals['alpha'])
+                tensor.set(param='gamma', value=orient_vals['gamma'])
 
         # The orientational parameter set {beta, gamma}.
-        if orient_params.count('beta') == 1 and orient_params.count('gamma') == 1:
+        elif 'beta' in orient_vals and 'gamma' in orient_vals:
             if errors:
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')], category='err')
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')], category='err')
+                tensor.set(param='beta', value=orient_vals['beta'], category='err')
+                tensor.set(param='gamma', value=orient_vals['gamma'], category='err')
             else:
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')])
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')])
-
-        # Unknown parameter combination.
-        else:
-            raise RelaxUnknownParamCombError('orientational parameter set', orient_params)
+                tensor.set(param='beta', value=orient_vals['beta'])
+                tensor.set(param='gamma', value=orient_vals['gamma'])
 
     # Three orientational parameters.
     elif len(orient_params) == 3:
         # The orientational parameter set {alpha, beta, gamma}.
-        if orient_params.count('alpha') == 1 and orient_params.count('beta') == 1:
-            if errors:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')], category='err')
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')], category='err')
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')], category='err')
-            else:
-                tensor.set(param='alpha', value=orient_values[orient_params.index('alpha')])
-                tensor.set(param='beta', value=orient_values[orient_params.index('beta')])
-                tensor.set(param='gamma', value=orient_values[orient_params.index('gamma')])
-
-        # Unknown parameter combination.
+        if errors:
+            tensor.set(param='alpha', value=orient_vals['alpha'], category='err')
+            tensor.set(param='beta', value=orient_vals['beta'], category='err')
+            tensor.set(param='gamma', value=orient_vals['gamma'], category='err')
         else:
-            raise RelaxUnknownParamCombError('orientational parameter set', orient_params)
-
-    # More than three orientational parameters.
-    elif len(orient_params) > 3:
-        raise RelaxUnknownParamCombError('orientational parameter set', orient_params)
+            tensor.set(param='alpha', value=orient_vals['alpha'])
+            tensor.set(param='beta', value=orient_vals['beta'])
+            tensor.set(param='gamma', value=orient_vals['gamma'])
 
 
     # Fold the angles in.
@@ -1942,6 +1893,45 @@ __set_prompt_doc__ = """
 """
 
 
+def set_batch(tensor=None, params=None, values=None, errors=False):
+    """Set all 5 geometric parameters of the tensor in one step.
+
+    The parameter set is converted into the internal {Axx, Ayy, Axy, Axz, Ayz} parameters using the precomputed linear transformation of the _GEO_MAPS table, rather than by comparing parameter names.
+
+
+    @keyword tensor:    The alignment tensor object.
+    @type tensor:       AlignTensorData instance
+    @keyword params:    The list of 5 geometric parameter names.  This must be one of the parameter sets accepted by the set() function.
+    @type params:       list of str
+    @keyword values:    The list of values to set the parameters to, in the same order as params.
+    @type values:       list of float or rank-1, 5D numpy array
+    @keyword errors:    A flag which determines if the alignment tensor data or its errors are being input.
+    @type errors:       bool
+    """
+
+    # The transformation for this parameter set.
+    sig = frozenset(params)
+    if len(params) != 5 or sig not in _GEO_MAPS:
+        raise RelaxUnknownParamCombError('geometric parameter set', params)
+    names, matrix, offset = _GEO_MAPS[sig]
+
+    # Reorder the values to match the transformation.
+    vals = dict(zip(params, values))
+    vect = array([vals[name] for name in names], float64)
+
+    # Convert to the internal parameters.
+    internal = (dot(matrix, vect) + offset).tolist()
+
+    # The parameter category.
+    category = 'val'
+    if errors:
+        category = 'err'
+
+    # Set the internal parameter values.
+    for i in range(5):
+        tensor.set(param=_GEO_INTERNAL[i], value=internal[i], category=category)
+
+
 def set_align_id(tensor=None, align_id=None):
     """Set the align ID string for the given tensor.
 
@@ -2033,41 +2023,25 @@ def svd(basis_set=0, tensors=None):
     if not hasattr(cdp, 'align_tensors') or len(cdp.align_tensors) == 0:
         raise RelaxNoTensorError('alignment')
 
-    # Count the number of tensors used in the SVD.
-    tensor_num = 0
-    for tensor in cdp.align_tensors:
-        if tensors and tensor.name not in tensors:
-            continue
-        tensor_num = tensor_num + 1
-
-    # Create the matrix to apply SVD on.
-    matrix = zeros((tensor_num, 5), float64)
-
-    # Pack the elements.
-    i = 0
+    # Gather the contiguous {Sxx, Syy, Sxy, Sxz, Syz} 5D vectors of the tensors used in the SVD.
+    vectors = []
     for tensor in cdp.align_tensors:
         # Skip tensors.
         if tensors and tensor.name not in tensors:
             continue
 
-        # Unitary basis set.
-        if basis_set == 0:
-            matrix[i, 0] = tensor.Sxx
-            matrix[i, 1] = tensor.Syy
-            matrix[i, 2] = tensor.Sxy
-            matrix[i, 3] = tensor.Sxz
-            matrix[i, 4] = tensor.Syz
+        # Pack the elements.
+        vectors.append(tensor.S_5D)
 
-        # Geometric basis set.
-        elif basis_set == 1:
-            matrix[i, 0] = tensor.Szz
-            matrix[i, 1] = tensor.Sxxyy
-            matrix[i, 2] = tensor.Sxy
-            matrix[i, 3] = tensor.Sxz
-            matrix[i, 4] = tensor.Syz
+    # Create the matrix to apply SVD on (the unitary basis set).
+    matrix = array(vectors, float64)
 
-        # Increment the index.
-        i = i + 1
+    # Convert to the geometric basis set, Szz = - Sxx - Syy and Sxx-yy = Sxx - Syy.
+    if basis_set == 1:
+        Sxx = matrix[:, 0].copy()
+        Syy = matrix[:, 1].copy()
+        matrix[:, 0] = - Sxx - Syy
+        matrix[:, 1] = Sxx - Syy
 
     # SVD.
     u, s, vh = linalg.svd(matrix)
@@ -575,10 +575,10 @@ def return_interatom_list(spin_id=None, pipe=None):
     # Initialise.
     interatoms = []
 
-    # Find and append all containers.
-    for i in range(len(dp.interatomic)):
-        if id_match(spin_id=spin_id, interatom=dp.interatomic[i], pipe=pipe) or id_match(spin_id=spin_id, interatom=dp.interatomic[i], pipe=pipe):
-            interatoms.append(dp.interatomic[i])
+    # Find and append all containers (id_match() checks both spins of the pair).
+    for interatom in dp.interatomic:
+        if id_match(spin_id=spin_id, interatom=interatom, pipe=pipe):
+            interatoms.append(interatom)
 
     # Return the list of containers.
     return interatoms
@@ -24,7 +24,7 @@
 
 
 # Python module imports.
-from numpy import float64, array, zeros
+from numpy import array, broadcast_arrays, empty, float64, linspace, minimum, ogrid, transpose, zeros
 from time import asctime, localtime
 
 # relax module imports.
@@ -81,21 +81,27 @@ def map(params=None, map_type='Iso3D', spin_id=None, inc=20, lower=None, upper=N
     if axis_incs <= 1:
         raise RelaxError("The axis increment value needs to be greater than 1.")
 
-    # Space type.
-    if map_type.lower() == "iso3d":
-        if len(params) != 3:
-            raise RelaxError("The 3D isosurface map requires a 3 parameter model.")
-
-        # Create the map.
-        Map(params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, remap)
-    else:
+    # The map class for the space type.
+    map_class = _MAP_TYPES.get(map_type.lower())
+    if map_class == None:
         raise RelaxError("The map type '" + map_type + "' is not supported.")
 
+    # Check the number of parameters.
+    if len(params) != map_class.num_params:
+        raise RelaxError("The %s map requires a %i parameter model." % (map_class.desc, map_class.num_params))
+
+    # Create the map.
+    map_class(params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, remap)
+
 
 
 class Map:
     """The space mapping base class."""
 
+    # The number of parameters and the description of the map.
+    num_params = 3
+    desc = "3D isosurface"
+
     def __init__(self, params, spin_id, inc, lower, upper, axis_incs, file_prefix, dir, point, point_file, remap):
         """Map the space upon class instantiation."""
 
@@ -117,27 +123,16 @@ class Map:
         self.calculate = get_specific_fn('calculate', cdp.pipe_type)
         self.model_stats = get_specific_fn('model_stats', cdp.pipe_type)
         self.return_data_name = get_specific_fn('return_data_name', cdp.pipe_type)
-        self.map_bounds = []
-        self.return_conversion_factor = []
-        self.return_units = []
-        for i in range(self.n):
-            self.map_bounds.append(get_specific_fn('map_bounds', cdp.pipe_type))
-            self.return_conversion_factor.append(get_specific_fn('return_conversion_factor', cdp.pipe_type))
-            self.return_units.append(get_specific_fn('return_units', cdp.pipe_type))
+        self.map_bounds = get_specific_fn('map_bounds', cdp.pipe_type)
+        self.return_conversion_factor = get_specific_fn('return_conversion_factor', cdp.pipe_type)
+        self.return_units = get_specific_fn('return_units', cdp.pipe_type)
 
         # Diffusion tensor parameter flag.
-        self.diff_params = zeros(self.n)
+        self.diff_params = zeros(self.n, bool)
 
         # Get the parameter names.
         self.get_param_names()
 
-        # Specific function setup (for diffusion tensor parameters).
-        for i in range(self.n):
-            if self.diff_params[i]:
-                self.map_bounds[i] = diffusion_tensor.map_bounds
-                self.return_conversion_factor[i] = diffusion_tensor.return_conversion_factor
-                self.return_units[i] = diffusion_tensor.return_units
-
         # Points.
         if point != None:
             self.point = array(point, float64)
@@ -148,8 +143,11 @@ class Map:
         # Get the default map bounds.
         self.bounds = zeros((self.n, 2), float64)
         for i in range(self.n):
-            # Get the bounds for the parameter i.
-            bounds = self.map_bounds[i](self.param_names[i], self.spin_id)
+            # Get the bounds for the parameter i (diffusion tensor parameters use the diffusion tensor function).
+            if self.diff_params[i]:
+                bounds = diffusion_tensor.map_bounds(self.param_names[i], self.spin_id)
+            else:
+                bounds = self.map_bounds(self.param_names[i], self.spin_id)
 
             # No bounds found.
             if not bounds:
@@ -197,14 +195,97 @@ class Map:
         self.create_map()
 
 
+    def calc_chi2_grid(self):
+        """Calculate the chi-squared value at all points of the 3D grid.
+
+        @return:    The chi-squared values, with the indices corresponding to the increments of the three parameters.
+        @rtype:     numpy rank-3 array
+        """
+
+        # Initialise.
+        dim_points = self.inc + 1
+        percent = 0.0
+        percent_inc = 100.0 / dim_points**(self.n - 1)
+        next_print = 1.0
+        progress_format = "%-10s%8.3f%%,  [%g, %g, %g],  f(x): %-8g"
+        print("%-10s%8.3f%-1s" % ("Progress:", percent, "%"))
+
+        # The chi-squared values already calculated, keyed by the parameter values (for collapsed dimensions of the grid).
+        chi2_cache = {}
+
+        # The parameter values of all grid points, from the broadcast increments of each axis (the third parameter varying fastest).
+        inc_i, inc_j, inc_k = ogrid[0:dim_points, 0:dim_points, 0:dim_points]
+        grid = broadcast_arrays(self.bounds[0, 0] + inc_i*self.step_size[0], self.bounds[1, 0] + inc_j*self.step_size[1], self.bounds[2, 0] + inc_k*self.step_size[2])
+        points = transpose(array([axis.ravel() for axis in grid]))
+
+        # The chi-squared values of all grid points (every element is filled below).
+        chi2_grid = empty(len(points), float64)
+
+        # The arguments of the value setting, calculation and statistics functions, fixed for the whole grid.
+        if self.spin_id:
+            set_args = {'spin_id': self.spin_id}
+            calc_args = {'spin_id': self.spin_id, 'verbosity': 0}
+            stats_args = {'spin_id': self.spin_id}
+        else:
+            set_args = {}
+            calc_args = {'verbosity': 0}
+            stats_args = {'model_info': 0}
+
+        # Local aliases for the loop.
+        params = self.params
+        set_value = value.set
+        calculate = self.calculate
+        model_stats = self.model_stats
+        last_index = len(points) - 1
+
+        # Loop over the grid points.
+        for index in range(len(points)):
+            # The parameter values.
+            values = points[index]
+
+            # The point has already been calculated.
+            key = (values[0], values[1], values[2])
+            if key in chi2_cache:
+                chi2 = chi2_cache[key]
+
+            # Calculate the point.
+            else:
+                # Set the parameter values.
+                set_value(val=values, param=params, force=True, **set_args)
+
+                # Calculate the function values.
+                calculate(**calc_args)
+
+                # Get the minimisation statistics for the model.
+                k, n, chi2 = model_stats(**stats_args)
+
+                # Store the value.
+                chi2_cache[key] = chi2
+
+            # Store the value.
+            chi2_grid[index] = chi2
+
+            # Progress incrementation, once the third parameter has been looped over.
+            if (index + 1) % dim_points == 0:
+                percent = percent + percent_inc
+
+                # Printout, at most once per percent and for the last point.
+                if percent >= next_print or index == last_index:
+                    print(progress_format % ("Progress:", percent, values[0], values[1], values[2], chi2))
+                    next_print = percent + 1.0
+
+        # Return the values as a 3D grid.
+        return chi2_grid.reshape((dim_points, dim_points, dim_points))
+
+
     def create_map(self):
         """Function for creating the map."""
 
         # Print out.
         print("\nCreating the map.")
 
-        # Open the file.
-        map_file = open_write_file(file_name=self.file_prefix, dir=self.dir, force=True)
+        # Open the file, with a large write buffer for the many map lines.
+        map_file = open_write_file(file_name=self.file_prefix, dir=self.dir, force=True, buffer_size=1048576)
 
         # Generate and write the text of the map.
         self.map_3D_text(map_file)
@@ -240,7 +321,7 @@ class Map:
                     name = diff_name
 
                     # Set the flag indicating if there are diffusion tensor parameters.
-                    self.diff_params[i] = 1
+                    self.diff_params[i] = True
 
             # Bad parameter name.
             if not name:
@@ -253,71 +334,22 @@ class Map:
     def map_3D_text(self, map_file):
         """Function for creating the text of a 3D map."""
 
-        # Initialise.
-        values = zeros(3, float64)
-        percent = 0.0
-        percent_inc = 100.0 / (self.inc + 1.0)**(self.n - 1.0)
-        print("%-10s%8.3f%-1s" % ("Progress:", percent, "%"))
-
         # Fix the diffusion tensor.
         unfix = False
         if hasattr(cdp, 'diff_tensor') and not cdp.diff_tensor.fixed:
             cdp.diff_tensor.fixed = True
             unfix = True
 
-        # Initial value of the first parameter.
-        values[0] = self.bounds[0, 0]
-
-        # The model identifier.
-
-        # Loop over the first parameter.
-        for i in range((self.inc + 1)):
-            # Initial value of the second parameter.
-            values[1] = self.bounds[1, 0]
-
-            # Loop over the second parameter.
-            for j in range((self.inc + 1)):
-                # Initial value of the third parameter.
-                values[2] = self.bounds[2, 0]
-
-                # Loop over the third parameter.
-                for k in range((self.inc + 1)):
-                    # Set the parameter values.
-                    if self.spin_id:
-                        value.set(val=values, param=self.params, spin_id=self.spin_id, force=True)
-                    else:
-                        value.set(val=values, param=self.params, force=True)
-
-                    # Calculate the function values.
-                    if self.spin_id:
-                        self.calculate(spin_id=self.spin_id, verbosity=0)
-                    else:
-                        self.calculate(verbosity=0)
-
-                    # Get the minimisation statistics for the model.
-                    if self.spin_id:
-                        k, n, chi2 = self.model_stats(spin_id=self.spin_id)
-                    else:
-                        k, n, chi2 = self.model_stats(model_info=0)
-
-                    # Set maximum value to 1e20 to stop the OpenDX server connection from breaking.
-                    if chi2 > 1e20:
-                        map_file.write("%30f\n" % 1e20)
-                    else:
-                        map_file.write("%30f\n" % chi2)
-
-                    # Increment the value of the third parameter.
-                    values[2] = values[2] + self.step_size[2]
-
-                # Progress incrementation and printout.
-                percent = percent + percent_inc
-                print("%-10s%8.3f%-8s%-8g" % ("Progress:", percent, "%,  " + repr(values) + ",  f(x): ", chi2))
+        # Calculate the chi-squared values of the grid.
+        chi2_grid = self.calc_chi2_grid()
 
-                # Increment the value of the second parameter.
-                values[1] = values[1] + self.step_size[1]
+        # Set maximum value to 1e20 to stop the OpenDX server connection from breaking.
+        chi2_grid = minimum(chi2_grid, 1e20)
 
-            # Increment the value of the first parameter.
-            values[0] = values[0] + self.step_size[0]
+        # Format and write out the values, one plane of the first parameter at a time to bound the size of the text (the third parameter varying fastest).
+        for plane in chi2_grid:
+            chi2_list = plane.ravel().tolist()
+            map_file.write(("%30f\n" * len(chi2_list)) % tuple(chi2_list))
 
         # Unfix the diffusion tensor.
         if unfix:
@@ -328,44 +360,42 @@ class Map:
         """Function for creating labels, tick locations, and tick values for an OpenDX map."""
 
         # Initialise.
-        self.labels = "{"
+        labels = []
         self.tick_locations = []
         self.tick_values = []
-        loc_inc = float(self.inc) / float(self.axis_incs)
+
+        # The tick locations, identical for all axes.
+        locs = linspace(0.0, float(self.inc), self.axis_incs + 1).tolist()
+        tick_locations = "{ " + " ".join([repr(loc) for loc in locs]) + " }"
 
         # Loop over the parameters
         for i in range(self.n):
-            # Parameter conversion factors.
-            factor = self.return_conversion_factor[i](self.param_names[i])
-
-            # Parameter units.
-            units = self.return_units[i](self.param_names[i])
+            # Parameter conversion factors and units (diffusion tensor parameters use the diffusion tensor functions).
+            if self.diff_params[i]:
+                factor = diffusion_tensor.return_conversion_factor(self.param_names[i])
+                units = diffusion_tensor.return_units(self.param_names[i])
+            else:
+                factor = self.return_conversion_factor(self.param_names[i])
+                units = self.return_units(self.param_names[i])
 
             # Labels.
             if units:
-                self.labels = self.labels + "\"" + self.params[i] + " (" + units + ")\""
+                labels.append("\"" + self.params[i] + " (" + units + ")\"")
             else:
-                self.labels = self.labels + "\"" + self.params[i] + "\""
-
-            if i < self.n - 1:
-                self.labels = self.labels + " "
-            else:
-                self.labels = self.labels + "}"
+                labels.append("\"" + self.params[i] + "\"")
 
             # Tick values.
-            vals = self.bounds[i, 0] / factor
-            val_inc = (self.bounds[i, 1] - self.bounds[i, 0]) / (self.axis_incs * factor)
-
-            string = ""
-            for j in range(self.axis_incs + 1):
-                string = string + "\"" + "%.2f" % vals + "\" "
-                vals = vals + val_inc
-            self.tick_values.append("{" + string + "}")
+            vals = linspace(self.bounds[i, 0], self.bounds[i, 1], self.axis_incs + 1) / factor
+            self.tick_values.append("{" + "".join(["\"%.2f\" " % val for val in vals]) + "}")
 
             # Tick locations.
-            string = ""
-            val = 0.0
-            for j in range(self.axis_incs + 1):
-                string = string + " " + repr(val)
-                val = val + loc_inc
-            self.tick_locations.append("{" + string + " }")
+            self.tick_locations.append(tick_locations)
+
+        # Join the labels.
+        self.labels = "{" + " ".join(labels) + "}"
+
+
+# The map classes, keyed by the lowercase map type.
+_MAP_TYPES = {
+    'iso3d': Map
+}
@@ -87,24 +87,19 @@ def back_calc(align_id=None):
         if type(pos[0]) in [float, float64]:
             pos = [pos] * cdp.N
 
+        # The vectors and their lengths for all states (these are independent of the alignment).
+        vect = array(pos[:cdp.N], float64) - cdp.paramagnetic_centre
+        r = (vect**2).sum(axis=1)**0.5
+
+        # Normalise (only the vectors with length).
+        mask = r != 0.0
+        vect[mask] = vect[mask] / r[mask, None]
+
         # Loop over the alignments.
         for id in align_ids:
-            # Vectors.
-            vect = zeros((cdp.N, 3), float64)
-            r = zeros(cdp.N, float64)
+            # Calculate the PCS constants.
             dj = zeros(cdp.N, float64)
             for c in range(cdp.N):
-                # The vector.
-                vect[c] = pos[c] - cdp.paramagnetic_centre
-
-                # The length.
-                r[c] = norm(vect[c])
-
-                # Normalise (only if the vector has length).
-                if r[c]:
-                    vect[c] = vect[c] / r[c]
-
-                # Calculate the PCS constant.
                 dj[c] = pcs_constant(cdp.temperature[id], cdp.spectrometer_frq[id] * 2.0 * pi / g1H, r[c]/1e10)
 
             # Initialise if necessary.
@@ -1035,8 +1030,8 @@ def structural_noise(align_id=None, rmsd=0.2, sim_num=1000, file=None, dir=None,
                 # Calculate the PCS constant.
                 dj = pcs_constant(cdp.temperature[id], cdp.spectrometer_frq[id] * 2.0 * pi / g1H, r/1e10)
 
-                # Calculate the PCS value (in ppm).
-                pcs[id][i] = pcs_tensor(dj, vect, cdp.align_tensors[get_tensor_index(id)].A) * 1e6
+                # Calculate the PCS value (the conversion to ppm is applied to the standard deviation below).
+                pcs[id][i] = pcs_tensor(dj, vect, cdp.align_tensors[get_tensor_index(id)].A)
 
         # Initialise if necessary.
         if not hasattr(spin, 'pcs_struct_err'):
@@ -1050,8 +1045,8 @@ def structural_noise(align_id=None, rmsd=0.2, sim_num=1000, file=None, dir=None,
                 align_index += 1
                 continue
 
-            # The PCS standard deviation.
-            sd = std(pcs[id])
+            # The PCS standard deviation (in ppm).
+            sd = std(pcs[id]) * 1e6
 
             # Remove the previous error.
             if id in spin.pcs_struct_err:
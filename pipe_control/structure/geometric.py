@@ -20,8 +20,8 @@
 ###############################################################################
 
 # Python module imports.
-from math import cos, pi, sin
-from numpy import arccos, array, dot, eye, float64, zeros
+from math import pi
+from numpy import arccos, array, cos as cos_vect, dot, eye, float64, outer, sin as sin_vect, zeros
 from os import getcwd
 
 # relax module imports.
@@ -357,6 +357,9 @@ def generate_vector_dist(mol=None, res_name=None, res_num=None, chain_id='', cen
     else:
         phi, theta = angles_regular(inc)
 
+    # Rotate, warp, scale and centre all vectors at once.
+    positions = centre + dot(array(vectors), dot(warp, R).T) * scale
+
     # Init the arrays for stitching together.
     edge = zeros(len(theta))
     edge_index = zeros(len(theta), int)
@@ -395,17 +398,8 @@ def generate_vector_dist(mol=None, res_name=None, res_num=None, chain_id='', cen
                     print("%sEdge phi pos: %s" % (" "*8, edge_phi[i]))
                     print("%sEdge atom: %s" % (" "*8, edge_atom[i]))
 
-            # Rotate the vector into the frame.
-            vector = dot(R, vectors[i + j*len(theta)])
-
-            # Warp the vector.
-            vector = dot(warp, vector)
-
-            # Scale the vector.
-            vector = vector * scale
-
-            # Position relative to the centre of mass.
-            pos = centre + vector
+            # The rotated, warped and scaled vector position relative to the centre of mass.
+            pos = positions[i + j*len(theta)]
 
             # Debugging.
             if debug:
@@ -574,24 +568,12 @@ def vect_dist_spherical_angles(inc=20, distribution='uniform'):
     else:
         phi, theta = angles_regular(inc)
 
-    # Initialise array of the distribution of vectors.
-    vectors = []
-
-    # Loop over the longitudinal lines.
-    for j in range(len(phi)):
-        # Loop over the latitudinal lines.
-        for i in range(len(theta)):
-            # X coordinate.
-            x = cos(theta[i]) * sin(phi[j])
-
-            # Y coordinate.
-            y =  sin(theta[i])* sin(phi[j])
-
-            # Z coordinate.
-            z = cos(phi[j])
-
-            # Append the vector.
-            vectors.append(array([x, y, z], float64))
+    # The vectors for all longitudinal (first index) and latitudinal (second index) lines.
+    sin_phi = sin_vect(phi)
+    vectors = zeros((len(phi), len(theta), 3), float64)
+    vectors[:, :, 0] = outer(sin_phi, cos_vect(theta))
+    vectors[:, :, 1] = outer(sin_phi, sin_vect(theta))
+    vectors[:, :, 2] = cos_vect(phi)[:, None]
 
     # Return the array of vectors and angles.
-    return vectors
+    return list(vectors.reshape(len(phi)*len(theta), 3))
@@ -47,6 +47,9 @@ class API_base(object):
         # Class variables.
         self.PARAMS = Param_list()
 
+        # A cache of the data_names() lists, keyed by the method arguments.
+        self._data_names_cache = {}
+
 
     def back_calc_ri(self, spin_index=None, ri_id=None, ri_type=None, frq=None):
         """Back-calculation of relaxation data.
@@ -178,15 +181,15 @@ class API_base(object):
         @rtype:                 list of str
         """
 
-        # Initialise.
-        names = []
+        # The cache key.
+        key = (set, scope, error_names, sim_names)
 
-        # Loop over the parameters.
-        for name in self.PARAMS.loop(set=set, scope=scope, error_names=error_names, sim_names=sim_names):
-            names.append(name)
+        # Build and store the list of names on the first call.
+        if key not in self._data_names_cache:
+            self._data_names_cache[key] = list(self.PARAMS.loop(set=set, scope=scope, error_names=error_names, sim_names=sim_names))
 
-        # Return the names.
-        return names
+        # Return a copy of the names, as the list may be modified by the caller.
+        return self._data_names_cache[key][:]
 
 
     def data_type(self, param=None):
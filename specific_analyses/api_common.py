@@ -24,6 +24,7 @@
 
 # Python module imports.
 from copy import deepcopy
+from numpy import array, ndarray
 
 # relax module imports.
 from data_store.mol_res_spin import SpinContainer
@@ -32,6 +33,13 @@ from lib.errors import RelaxError, RelaxLenError, RelaxNoSequenceError
 from pipe_control.mol_res_spin import count_spins, exists_mol_res_spin_data, return_spin, spin_loop
 
 
+# A sentinel for distinguishing missing objects from objects set to None.
+_MISSING = object()
+
+# The immutable types which do not need to be copied.
+_IMMUTABLE_TYPES = (bool, int, float, complex, str)
+
+
 class API_common:
     """Base class containing API methods common to multiple analysis types."""
 
@@ -44,16 +52,32 @@ class API_common:
         @rtype:     str
         """
 
-        # Loop over the spins.
-        for spin, spin_id in spin_loop(return_id=True):
-            # Skip deselected spins.
-            if not spin.select:
-                continue
-
+        # Loop over the selected spins (skipping the deselected spins before their IDs are generated).
+        for spin, spin_id in spin_loop(return_id=True, skip_desel=True):
             # Yield the spin id string.
             yield spin_id
 
 
+    def _copy_select_sim(self, select_sim):
+        """Return a copy of the simulation selection flags.
+
+        As the flags are immutable bools, a shallow copy is sufficient.
+
+
+        @param select_sim:  The selection flags for the simulations.
+        @type select_sim:   list of bool or numpy bool array
+        @return:            The copy of the selection flags.
+        @rtype:             list of bool or numpy bool array
+        """
+
+        # Numpy arrays.
+        if isinstance(select_sim, ndarray):
+            return select_sim.copy()
+
+        # Lists.
+        return list(select_sim)
+
+
     def _create_mc_relax_data(self, data_id):
         """Return the Monte Carlo relaxation data list for the corresponding spin.
 
@@ -64,15 +88,9 @@ class API_common:
         # Get the spin container.
         spin = return_spin(data_id)
 
-        # Initialise the data structure.
-        data = []
-
-        # Add the data.
-        for ri_id in cdp.ri_ids:
-            data.append(spin.ri_data[ri_id])
-
         # Return the data.
-        return data
+        ri_data = spin.ri_data
+        return [ri_data[ri_id] for ri_id in cdp.ri_ids]
 
 
     def _data_init_dummy(self, data_cont, sim=False):
@@ -97,10 +115,14 @@ class API_common:
         @type sim:          bool
         """
 
-        # Loop over the parameters.
-        for name in self.PARAMS.loop(set='params', scope='spin', error_names=False, sim_names=sim):
+        # The loop invariants.
+        model_params = data_cont.params
+        get_type = self.PARAMS.get_type
+
+        # Loop over the parameters (using the cached list of names).
+        for name in self.data_names(set='params', scope='spin', error_names=False, sim_names=sim):
             # Not a parameter of the model.
-            if name not in data_cont.params:
+            if name not in model_params:
                 continue
 
             # The value already exists.
@@ -108,7 +130,7 @@ class API_common:
                 continue
 
             # The default value.
-            param_type = self.PARAMS.get_type(name)
+            param_type = get_type(name)
             if param_type == dict:
                 value = {}
             elif param_type == list:
@@ -151,31 +173,43 @@ class API_common:
         @rtype:     bool
         """
 
-        # Diffusion tensor errors.
+        # Diffusion tensor errors (only the instance objects are checked, as the class methods cannot be errors).
         if hasattr(cdp, 'diff'):
-            for object_name in dir(cdp.diff):
-                # The object error name.
-                object_error = object_name + '_err'
-
+            for object_name in vars(cdp.diff):
                 # Error exists.
-                if hasattr(cdp.diff, object_error):
+                if object_name.endswith('_err'):
                     return True
 
         # Loop over the sequence.
         for spin in spin_loop():
             # Parameter errors.
-            for object_name in dir(spin):
-                # The object error name.
-                object_error = object_name + '_err'
-
+            for object_name in vars(spin):
                 # Error exists.
-                if hasattr(spin, object_error):
+                if object_name.endswith('_err'):
                     return True
 
         # No errors found.
         return False
 
 
+    def _is_flat(self, values):
+        """Determine if the sequence only contains immutable objects, so that a shallow copy is sufficient.
+
+        @param values:  The sequence of objects.
+        @type values:   list
+        @return:        True if all elements are None or of an immutable type, False otherwise.
+        @rtype:         bool
+        """
+
+        # Check each element.
+        for element in values:
+            if element is not None and not isinstance(element, _IMMUTABLE_TYPES):
+                return False
+
+        # Flat.
+        return True
+
+
     def _is_spin_param_true(self, name):
         """Dummy method stating that the parameter is spin specific.
 
@@ -201,12 +235,8 @@ class API_common:
         @rtype:     SpinContainer instance
         """
 
-        # Loop over the sequence.
-        for spin in spin_loop():
-            # Skip deselected spins.
-            if not spin.select:
-                continue
-
+        # Loop over the selected spins of the sequence.
+        for spin in spin_loop(skip_desel=True):
             # Yield the spin container.
             yield spin
 
@@ -287,19 +317,9 @@ class API_common:
         @rtype:         list of float
         """
 
-        # Convert to a list.
-        data = []
-        for ri_id in cdp.ri_ids:
-            # Handle missing data.
-            if ri_id not in spin.ri_data:
-                data.append(None)
-
-            # Append the value.
-            else:
-                data.append(spin.ri_data[ri_id])
-
-        # Return the list.
-        return data
+        # Convert to a list, with None for the missing data.
+        ri_data = spin.ri_data
+        return [ri_data.get(ri_id) for ri_id in cdp.ri_ids]
 
 
     def _return_error_relax_data(self, data_id):
@@ -314,19 +334,9 @@ class API_common:
         # Get the spin container.
         spin = return_spin(data_id)
 
-        # Convert to a list.
-        error = []
-        for ri_id in cdp.ri_ids:
-            # Handle missing data/errors.
-            if ri_id not in spin.ri_data_err:
-                error.append(None)
-
-            # Append the value.
-            else:
-                error.append(spin.ri_data_err[ri_id])
-
-        # Return the list.
-        return error
+        # Convert to a list, with None for the missing data/errors.
+        ri_data_err = spin.ri_data_err
+        return [ri_data_err.get(ri_id) for ri_id in cdp.ri_ids]
 
 
     def _return_value_general(self, spin, param, sim=None, bc=False):
@@ -386,21 +396,22 @@ class API_common:
         if sim != None:
             object_name = object_sim
 
-        # The spin value.
-        if hasattr(spin, object_name):
-            value = getattr(spin, object_name)
+        # The spin value (a single look up, defaulting to the initial value of None).
+        value = getattr(spin, object_name, None)
 
         # The spin error.
-        if hasattr(spin, object_error):
-            error = getattr(spin, object_error)
+        spin_error = getattr(spin, object_error, _MISSING)
+        if spin_error is not _MISSING:
+            error = spin_error
 
         # The global value.
-        elif hasattr(cdp, object_name):
-            value = getattr(cdp, object_name)
+        else:
+            global_value = getattr(cdp, object_name, _MISSING)
+            if global_value is not _MISSING:
+                value = global_value
 
-            # The error.
-            if hasattr(cdp, object_error):
-                error = getattr(cdp, object_error)
+                # The error.
+                error = getattr(cdp, object_error, None)
 
         # List object.
         if index != None:
@@ -448,17 +459,12 @@ class API_common:
             raise RelaxError("The model information argument is not a spin container.")
         spin = model_info
 
-        # Parameter increment counter.
-        inc = 0
+        # The residue specific parameters.
+        params = self.data_names(set='params')
 
-        # Loop over the residue specific parameters.
-        for param in self.data_names(set='params'):
-            # Return the parameter array.
-            if index == inc:
-                setattr(spin, param + "_err", error)
-
-            # Increment.
-            inc = inc + 1
+        # Set the parameter error.
+        if index < len(params):
+            setattr(spin, params[index] + "_err", error)
 
 
     def _set_param_values_global(self, param=None, value=None, spin_id=None, error=False, force=True):
@@ -480,6 +486,9 @@ class API_common:
         lib.arg_check.is_str_list(param, 'parameter name')
         lib.arg_check.is_list(value, 'parameter value')
 
+        # The current data pipe objects.
+        cdp_vars = vars(cdp)
+
         # Loop over the parameters.
         for i in range(len(param)):
             # Get the object's name.
@@ -494,7 +503,7 @@ class API_common:
                 obj_name += '_err'
 
             # Is the parameter already set.
-            if not force and hasattr(cdp, obj_name) and getattr(cdp, obj_name) != None:
+            if not force and cdp_vars.get(obj_name) != None:
                 raise RelaxError("The parameter '%s' already exists, set the force flag to True to overwrite." % param[i])
 
             # Set the parameter.
@@ -521,24 +530,23 @@ class API_common:
         lib.arg_check.is_list(value, 'parameter value')
 
         # Loop over the parameters.
+        obj_names = []
         for i in range(len(param)):
             # Is the parameter is valid?
             if not self.PARAMS.contains(param[i]):
                 raise RelaxError("The parameter '%s' is not valid for this data pipe type." % param[i])
 
-            # Spin loop.
-            for spin in spin_loop(spin_id):
-                # Skip deselected spins.
-                if not spin.select:
-                    continue
-
-                # The object name.
-                obj_name = param[i]
-                if error:
-                    obj_name += '_err'
+            # The object name.
+            obj_name = param[i]
+            if error:
+                obj_name += '_err'
+            obj_names.append(obj_name)
 
-                # Set the parameter.
-                setattr(spin, obj_name, value[i])
+        # Spin loop.
+        for spin in spin_loop(spin_id, skip_desel=True):
+            # Set the parameters.
+            for i in range(len(obj_names)):
+                setattr(spin, obj_names[i], value[i])
 
 
     def _set_selected_sim_global(self, model_info, select_sim):
@@ -551,7 +559,7 @@ class API_common:
         """
 
         # Set the array.
-        cdp.select_sim = deepcopy(select_sim)
+        cdp.select_sim = self._copy_select_sim(select_sim)
 
 
     def _set_selected_sim_spin(self, model_info, select_sim):
@@ -569,7 +577,7 @@ class API_common:
         spin = model_info
 
         # Set the array.
-        spin.select_sim = deepcopy(select_sim)
+        spin.select_sim = self._copy_select_sim(select_sim)
 
 
     def _set_update(self, param, spin):
@@ -582,75 +590,75 @@ class API_common:
         """
 
 
-    def _sim_init_values_spin(self):
-        """Initialise the Monte Carlo parameter values (spin system specific)."""
+    def _sim_copies(self, value, sim_number):
+        """Create the list of Monte Carlo simulation copies of the given value.
 
-        # Get the parameter object names.
-        param_names = self.data_names(set='params')
+        The simulation structures are kept as Python lists rather than numpy arrays, as the analyses append to them, store None for failed or missing simulations, and save them as lists in the XML results files.  For the dominant case of immutable float values, the list simply holds repeated references to the single value object.
 
-        # Get the minimisation statistic object names.
-        min_names = self.data_names(set='min')
 
+        @param value:       The parameter value to copy.
+        @type value:        anything
+        @param sim_number:  The number of simulations.
+        @type sim_number:   int
+        @return:            The list of copies of the value, one per simulation.
+        @rtype:             list
+        """
 
-        # Test if Monte Carlo parameter values have already been set.
-        #############################################################
+        # Immutable objects can be shared between the simulations.
+        if value is None or isinstance(value, _IMMUTABLE_TYPES):
+            return [value] * sim_number
 
-        # Loop over the spins.
-        for spin in spin_loop():
-            # Skip deselected spins.
-            if not spin.select:
-                continue
+        # Numeric arrays.
+        if isinstance(value, ndarray) and value.dtype != object:
+            return [value.copy() for j in range(sim_number)]
+
+        # Flat lists of immutable objects.
+        if type(value) == list and self._is_flat(value):
+            return [value[:] for j in range(sim_number)]
 
-            # Loop over all the parameter names.
-            for object_name in param_names:
-                # Name for the simulation object.
-                sim_object_name = object_name + '_sim'
+        # Flat dictionaries of immutable objects.
+        if type(value) == dict and self._is_flat(list(value.values())):
+            return [value.copy() for j in range(sim_number)]
+
+        # Deep copies for all other objects.
+        return [deepcopy(value) for j in range(sim_number)]
+
+
+    def _sim_init_values_spin(self):
+        """Initialise the Monte Carlo parameter values (spin system specific)."""
+
+        # Get the parameter object names, paired with the simulation object names.
+        param_names = tuple([(name, name + '_sim') for name in self.data_names(set='params')])
+
+        # Get the minimisation statistic object names, paired with the simulation object names.
+        min_names = tuple([(name, name + '_sim') for name in self.data_names(set='min')])
+
+        # The number of simulations and the copying function.
+        sim_number = cdp.sim_number
+        sim_copies = self._sim_copies
 
 
         # Set the Monte Carlo parameter values.
         #######################################
 
-        # Loop over the residues.
-        for spin in spin_loop():
-            # Skip deselected residues.
-            if not spin.select:
-                continue
+        # Loop over the selected spins, in a single pass.
+        for spin in spin_loop(skip_desel=True):
+            # The model parameters, as a set for fast membership tests.
+            model_params = set(spin.params)
 
             # Loop over all the data names.
-            for object_name in param_names:
+            for object_name, sim_object_name in param_names:
                 # Not a parameter of the model.
-                if object_name not in spin.params:
+                if object_name not in model_params:
                     continue
 
-                # Name for the simulation object.
-                sim_object_name = object_name + '_sim'
-
                 # Create the simulation object.
-                setattr(spin, sim_object_name, [])
-
-                # Get the simulation object.
-                sim_object = getattr(spin, sim_object_name)
-
-                # Loop over the simulations.
-                for j in range(cdp.sim_number):
-                    # Copy and append the data.
-                    sim_object.append(deepcopy(getattr(spin, object_name)))
+                setattr(spin, sim_object_name, sim_copies(getattr(spin, object_name), sim_number))
 
             # Loop over all the minimisation object names.
-            for object_name in min_names:
-                # Name for the simulation object.
-                sim_object_name = object_name + '_sim'
-
+            for object_name, sim_object_name in min_names:
                 # Create the simulation object.
-                setattr(spin, sim_object_name, [])
-
-                # Get the simulation object.
-                sim_object = getattr(spin, sim_object_name)
-
-                # Loop over the simulations.
-                for j in range(cdp.sim_number):
-                    # Copy and append the data.
-                    sim_object.append(deepcopy(getattr(spin, object_name)))
+                setattr(spin, sim_object_name, sim_copies(getattr(spin, object_name), sim_number))
 
 
     def _sim_pack_relax_data(self, data_id, sim_data):
@@ -666,19 +674,18 @@ class API_common:
         spin = return_spin(data_id)
 
         # Initialise the data structure.
-        spin.ri_data_sim = {}
+        ri_data_sim = {}
+        ri_ids = cdp.ri_ids
 
-        # Loop over the relaxation data.
-        for i in range(len(cdp.ri_ids)):
-            # The ID.
-            ri_id = cdp.ri_ids[i]
+        # Transpose the simulation data so that each row holds all simulations for a single relaxation data ID, converting back to lists of floats for storage in one step (an object array is used to preserve the None values of missing data, and the explicit shape handles zero simulations).
+        rows = array(sim_data[:cdp.sim_number], object).reshape(cdp.sim_number, len(ri_ids)).T.tolist()
 
-            # Initialise the MC data list.
-            spin.ri_data_sim[ri_id] = []
+        # Loop over the relaxation data.
+        for i in range(len(ri_ids)):
+            ri_data_sim[ri_ids[i]] = rows[i]
 
-            # Loop over the simulations.
-            for j in range(cdp.sim_number):
-                spin.ri_data_sim[ri_id].append(sim_data[j][i])
+        # Store the data.
+        spin.ri_data_sim = ri_data_sim
 
 
     def _sim_return_chi2_spin(self, model_info, index=None):
@@ -722,21 +729,13 @@ class API_common:
             raise RelaxError("The model information argument is not a spin container.")
         spin = model_info
 
-        # Parameter increment counter.
-        inc = 0
-
-        # Loop over the residue specific parameters.
-        for param in self.data_names(set='params'):
-            # Not a parameter of the model.
-            if param not in spin.params:
-                continue
-
-            # Return the parameter array.
-            if index == inc:
-                return getattr(spin, param + "_sim")
+        # The residue specific parameters of the model.
+        model_params = set(spin.params)
+        params = [param for param in self.data_names(set='params') if param in model_params]
 
-            # Increment.
-            inc = inc + 1
+        # Return the parameter array.
+        if index < len(params):
+            return getattr(spin, params[index] + "_sim")
 
 
     def _sim_return_selected_global(self, model_info):
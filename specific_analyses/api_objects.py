@@ -197,8 +197,8 @@ class Param_list:
         @raises RelaxError: If the parameter does not exist.
         """
 
-        # Check.
-        if name not in self._names:
+        # Check (using the type dictionary for a fast look up).
+        if name not in self._py_types:
             raise RelaxError("The parameter '%s' does not exist." % name)
 
 
@@ -211,8 +211,8 @@ class Param_list:
         @rtype:         bool
         """
 
-        # Check.
-        if name in self._names:
+        # Check (using the type dictionary for a fast look up).
+        if name in self._py_types:
             return True
 
         # No match.
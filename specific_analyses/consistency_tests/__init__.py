@@ -28,7 +28,6 @@ __all__ = [
 ]
 
 # Python module imports.
-from re import search
 from warnings import warn
 
 # relax module imports.
@@ -50,6 +49,9 @@ from user_functions.objects import Desc_container
 class Consistency_tests(API_base, API_common):
     """Class containing functions specific to consistency testing."""
 
+    # The consistency testing parameters, in the order of the error and simulation indices.
+    _param_names = ('j0', 'f_eta', 'f_r2')
+
     def __init__(self):
         """Initialise the class by placing API_common methods into the API."""
 
@@ -75,6 +77,34 @@ class Consistency_tests(API_base, API_common):
         self.PARAMS.add('orientation', scope='spin', default=15.7, units='degrees', desc="Angle between the 15N-1H vector and the principal axis of the 15N chemical shift tensor", py_type=float, grace_string='\\q\\xq\\Q')
         self.PARAMS.add('tc', scope='spin', default=13 * 1e-9, units='ns', desc="Correlation time", py_type=float, grace_string='\\q\\xt\\f{}c\\Q')
 
+        # The target function objects, keyed by the frequency and gyromagnetic ratios, for reuse between calculations (e.g. over the Monte Carlo simulations).
+        self._ct_cache = {}
+
+
+    def _ri_value(self, spin, ri_id, sim_index=None):
+        """Return the relaxation data value or simulation value for the given ID.
+
+        @param spin:        The spin container.
+        @type spin:         SpinContainer instance
+        @param ri_id:       The relaxation data ID string.
+        @type ri_id:        str or None
+        @keyword sim_index: The optional MC simulation index.
+        @type sim_index:    None or int
+        @return:            The relaxation data value, or None if there is no relaxation data ID.
+        @rtype:             float or None
+        """
+
+        # No data.
+        if ri_id == None:
+            return None
+
+        # The real data.
+        if sim_index == None:
+            return spin.ri_data[ri_id]
+
+        # The simulated data.
+        return spin.ri_data_sim[ri_id][sim_index]
+
 
     def _set_frq(self, frq=None):
         """Function for selecting which relaxation data to use in the consistency tests."""
@@ -91,10 +121,6 @@ class Consistency_tests(API_base, API_common):
         if hasattr(cdp, 'ct_frq'):
             raise RelaxError("The frequency for the run has already been set.")
 
-        # Create the data structure if it doesn't exist.
-        if not hasattr(cdp, 'ct_frq'):
-            cdp.ct_frq = {}
-
         # Set the frequency.
         cdp.ct_frq = frq
 
@@ -102,6 +128,9 @@ class Consistency_tests(API_base, API_common):
     def calculate(self, spin_id=None, verbosity=1, sim_index=None):
         """Calculation of the consistency functions.
 
+        All selected spins are calculated together in a single vectorised target function call per pair of gyromagnetic ratios.  For the Monte Carlo simulations, this method is called once per simulation index by pipe_control.minimise.calc().
+
+
         @keyword spin_id:   The spin identification string.
         @type spin_id:      None or str
         @keyword verbosity: The amount of information to print.  The higher the value, the greater the verbosity.
@@ -118,7 +147,21 @@ class Consistency_tests(API_base, API_common):
         if not exists_mol_res_spin_data():
             raise RelaxNoSequenceError
 
-        # Test if the spin data has been set.
+        # Frequency index.
+        if cdp.ct_frq not in cdp.spectrometer_frq.values():
+            raise RelaxError("No relaxation data corresponding to the frequency %s has been loaded." % cdp.ct_frq)
+
+        # The relaxation data IDs of each data type corresponding to the set frequency (the last ID wins if there are duplicates).
+        ids = {}
+        for ri_id in cdp.ri_ids:
+            if cdp.spectrometer_frq[ri_id] == cdp.ct_frq:
+                ids[cdp.ri_type[ri_id]] = ri_id
+        r1_id = ids.get('R1')
+        r2_id = ids.get('R2')
+        noe_id = ids.get('NOE')
+
+        # Test the spin data and gather it for all spins into groups sharing the same gyromagnetic ratios, in a single pass (nothing is stored in the spins until all spins have been tested).
+        groups = {}
         for spin, id in spin_loop(spin_id, return_id=True):
             # Skip deselected spins.
             if not spin.select:
@@ -129,18 +172,18 @@ class Consistency_tests(API_base, API_common):
                 raise RelaxSpinTypeError
 
             # Test if the CSA value has been set.
-            if not hasattr(spin, 'csa') or spin.csa == None:
+            if getattr(spin, 'csa', None) == None:
                 raise RelaxNoValueError("CSA")
 
             # Test if the angle Theta has been set.
-            if not hasattr(spin, 'orientation') or spin.orientation == None:
+            if getattr(spin, 'orientation', None) == None:
                 raise RelaxNoValueError("angle Theta")
 
             # Test if the correlation time has been set.
-            if not hasattr(spin, 'tc') or spin.tc == None:
+            if getattr(spin, 'tc', None) == None:
                 raise RelaxNoValueError("correlation time")
 
-            # Test the interatomic data.
+            # Loop over the interatomic data.
             interatoms = return_interatom_list(id)
             for interatom in interatoms:
                 # No relaxation mechanism.
@@ -159,101 +202,76 @@ class Consistency_tests(API_base, API_common):
                     raise RelaxSpinTypeError
 
                 # Test if the interatomic distance has been set.
-                if not hasattr(interatom, 'r') or interatom.r == None:
+                if getattr(interatom, 'r', None) == None:
                     raise RelaxNoValueError("interatomic distance", spin_id=spin_id, spin_id2=spin_id2)
 
-        # Frequency index.
-        if cdp.ct_frq not in cdp.spectrometer_frq.values():
-            raise RelaxError("No relaxation data corresponding to the frequency %s has been loaded." % cdp.ct_frq)
-
-        # Consistency testing.
-        for spin, id in spin_loop(spin_id, return_id=True):
-            # Skip deselected spins.
-            if not spin.select:
-                continue
+                # Gyromagnetic ratios.
+                gx = return_gyromagnetic_ratio(spin.isotope)
+                gh = return_gyromagnetic_ratio(spin2.isotope)
 
-            # Set the r1, r2, and NOE to None.
-            r1 = None
-            r2 = None
-            noe = None
+                # The interatomic distance.
+                r = interatom.r
 
             # Get the R1, R2, and NOE values corresponding to the set frequency.
-            for ri_id in cdp.ri_ids:
-                # The frequency does not match.
-                if cdp.spectrometer_frq[ri_id] != cdp.ct_frq:
-                    continue
-
-                # R1.
-                if cdp.ri_type[ri_id] == 'R1':
-                    if sim_index == None:
-                        r1 = spin.ri_data[ri_id]
-                    else:
-                        r1 = spin.ri_data_sim[ri_id][sim_index]
-
-                # R2.
-                if cdp.ri_type[ri_id] == 'R2':
-                    if sim_index == None:
-                        r2 = spin.ri_data[ri_id]
-                    else:
-                        r2 = spin.ri_data_sim[ri_id][sim_index]
-
-                # NOE.
-                if cdp.ri_type[ri_id] == 'NOE':
-                    if sim_index == None:
-                        noe = spin.ri_data[ri_id]
-                    else:
-                        noe = spin.ri_data_sim[ri_id][sim_index]
+            r1 = self._ri_value(spin, r1_id, sim_index)
+            r2 = self._ri_value(spin, r2_id, sim_index)
+            noe = self._ri_value(spin, noe_id, sim_index)
 
             # Skip the spin if not all of the three value exist.
             if r1 == None or r2 == None or noe == None:
                 continue
 
-            # Loop over the interatomic data.
-            interatoms = return_interatom_list(id)
-            for i in range(len(interatoms)):
-                # No relaxation mechanism.
-                if not interatoms[i].dipole_pair:
-                    continue
-
-                # The surrounding spins.
-                if id != interatoms[i].spin_id1:
-                    spin_id2 = interatoms[i].spin_id1
-                else:
-                    spin_id2 = interatoms[i].spin_id2
-                spin2 = return_spin(spin_id2)
-
-                # Gyromagnetic ratios.
-                gx = return_gyromagnetic_ratio(spin.isotope)
-                gh = return_gyromagnetic_ratio(spin2.isotope)
+            # Store the data as structures of arrays.
+            key = (gx, gh)
+            if key not in groups:
+                groups[key] = {'spins': [], 'orientation': [], 'tc': [], 'r': [], 'csa': [], 'r1': [], 'r2': [], 'noe': []}
+            group = groups[key]
+            group['spins'].append(spin)
+            group['orientation'].append(spin.orientation)
+            group['tc'].append(spin.tc)
+            group['r'].append(r)
+            group['csa'].append(spin.csa)
+            group['r1'].append(r1)
+            group['r2'].append(r2)
+            group['noe'].append(noe)
+
+        # Loop over the groups of spins.
+        for (gx, gh), group in groups.items():
+            # Initialise the function to calculate, or reuse an earlier instance.
+            key = (cdp.ct_frq, gx, gh)
+            if key not in self._ct_cache:
+                self._ct_cache[key] = Consistency(frq=cdp.ct_frq, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar)
+            self.ct = self._ct_cache[key]
+
+            # Calculate the consistency tests values for all spins at once (converting back to Python floats).
+            j0, f_eta, f_r2 = self.ct.func_vect(orientation=group['orientation'], tc=group['tc'], r=group['r'], csa=group['csa'], r1=group['r1'], r2=group['r2'], noe=group['noe'])
+            j0 = j0.tolist()
+            f_eta = f_eta.tolist()
+            f_r2 = f_r2.tolist()
+
+            # Store the values.
+            for i in range(len(group['spins'])):
+                spin = group['spins'][i]
 
-                # The interatomic distance.
-                r = interatoms[i].r
-
-            # Initialise the function to calculate.
-            self.ct = Consistency(frq=cdp.ct_frq, gx=gx, gh=gh, mu0=mu0, h_bar=h_bar)
-
-            # Calculate the consistency tests values.
-            j0, f_eta, f_r2 = self.ct.func(orientation=spin.orientation, tc=spin.tc, r=r, csa=spin.csa, r1=r1, r2=r2, noe=noe)
-
-            # Consistency tests values.
-            if sim_index == None:
-                spin.j0 = j0
-                spin.f_eta = f_eta
-                spin.f_r2 = f_r2
+                # Consistency tests values.
+                if sim_index == None:
+                    spin.j0 = j0[i]
+                    spin.f_eta = f_eta[i]
+                    spin.f_r2 = f_r2[i]
 
-            # Monte Carlo simulated consistency tests values.
-            else:
-                # Initialise the simulation data structures.
-                self.data_init(spin, sim=1)
-                if spin.j0_sim == None:
-                    spin.j0_sim = []
-                    spin.f_eta_sim = []
-                    spin.f_r2_sim = []
+                # Monte Carlo simulated consistency tests values.
+                else:
+                    # Initialise the simulation data structures, preallocated to the number of simulations.
+                    self.data_init(spin, sim=1)
+                    if spin.j0_sim == None or len(spin.j0_sim) != cdp.sim_number:
+                        spin.j0_sim = [None] * cdp.sim_number
+                        spin.f_eta_sim = [None] * cdp.sim_number
+                        spin.f_r2_sim = [None] * cdp.sim_number
 
-                # Consistency tests values.
-                spin.j0_sim.append(j0)
-                spin.f_eta_sim.append(f_eta)
-                spin.f_r2_sim.append(f_r2)
+                    # Consistency tests values.
+                    spin.j0_sim[sim_index] = j0[i]
+                    spin.f_eta_sim[sim_index] = f_eta[i]
+                    spin.f_r2_sim[sim_index] = f_r2[i]
 
 
     def data_init(self, data_cont, sim=False):
@@ -268,6 +286,9 @@ class Consistency_tests(API_base, API_common):
         # Get the data names.
         data_names = self.data_names()
 
+        # The existing objects of the container.
+        existing = vars(data_cont)
+
         # Loop over the data structure names.
         for name in data_names:
             # Simulation data structures.
@@ -276,7 +297,7 @@ class Consistency_tests(API_base, API_common):
                 name = name + '_sim'
 
             # If the name is not in 'data_cont', add it.
-            if not hasattr(data_cont, name):
+            if name not in existing:
                 # Set the attribute.
                 setattr(data_cont, name, None)
 
@@ -311,6 +332,11 @@ class Consistency_tests(API_base, API_common):
         if not exists_mol_res_spin_data():
             raise RelaxNoSequenceError
 
+        # The relaxation data IDs.
+        ri_ids = ()
+        if hasattr(cdp, 'ri_ids'):
+            ri_ids = tuple(cdp.ri_ids)
+
         # Loop over spin data.
         deselect_flag = False
         spin_count = 0
@@ -351,13 +377,15 @@ class Consistency_tests(API_base, API_common):
                 # The number of relaxation data points (and for infinite data).
                 data_points = 0
                 inf_data = False
-                if hasattr(cdp, 'ri_ids') and hasattr(spin, 'ri_data'):
-                    for id in cdp.ri_ids:
-                        if id in spin.ri_data and spin.ri_data[id] != None:
+                if hasattr(spin, 'ri_data'):
+                    get_ri_data = spin.ri_data.get
+                    for id in ri_ids:
+                        value = get_ri_data(id)
+                        if value is not None:
                             data_points += 1
 
                             # Infinite data!
-                            if isInf(spin.ri_data[id]):
+                            if isInf(value):
                                 inf_data = True
 
                 # Infinite data.
@@ -423,20 +451,9 @@ class Consistency_tests(API_base, API_common):
         @type error:        float
         """
 
-        # Alias.
-        spin = model_info
-
-        # Return J(0) sim data.
-        if index == 0:
-            spin.j0_err = error
-
-        # Return F_eta sim data.
-        if index == 1:
-            spin.f_eta_err = error
-
-        # Return F_R2 sim data.
-        if index == 2:
-            spin.f_r2_err = error
+        # Set the error for the parameter.
+        if index < len(self._param_names):
+            setattr(model_info, self._param_names[index] + '_err', error)
 
 
     def sim_return_param(self, model_info, index):
@@ -457,17 +474,9 @@ class Consistency_tests(API_base, API_common):
         if not spin.select:
                 return
 
-        # Return J(0) sim data.
-        if index == 0:
-            return spin.j0_sim
-
-        # Return F_eta sim data.
-        if index == 1:
-            return spin.f_eta_sim
-
-        # Return F_R2 sim data.
-        if index == 2:
-            return spin.f_r2_sim
+        # Return the parameter sim data.
+        if index < len(self._param_names):
+            return getattr(spin, self._param_names[index] + '_sim')
 
 
     def sim_return_selected(self, model_info):
@@ -31,7 +31,7 @@ from copy import deepcopy
 from math import cos, pi
 from minfx.generic import generic_minimise
 from minfx.grid import grid_point_array
-from numpy import arccos, array, dot, eye, float64, identity, ones, transpose, zeros
+from numpy import arccos, array, dot, empty, eye, float64, identity, ones, transpose, zeros
 from numpy.linalg import inv, norm
 from re import search
 import sys
@@ -784,7 +784,8 @@ class Frame_order(API_base, API_common):
         # Initialise.
         n = len(cdp.align_tensors.reduction)
         full_tensors = zeros(n*5, float64)
-        full_err = ones(n*5, float64) * 1e-5
+        full_err = empty(n*5, float64)
+        full_err.fill(1e-5)
         full_in_ref_frame = zeros(n, float64)
 
         # Loop over the full tensors.
@@ -1402,28 +1403,34 @@ class Frame_order(API_base, API_common):
             tensor.set(param='Axz', value=target_fn.A_5D_bc[5*i + 3])
             tensor.set(param='Ayz', value=target_fn.A_5D_bc[5*i + 4])
 
+        # The selected spins with PCS data, gathered once for all alignments.
+        pcs_spins = []
+        for spin in spin_loop(self._domain_moving()):
+            if spin.select and hasattr(spin, 'pcs'):
+                pcs_spins.append(spin)
+
+        # The interatomic data containers passing the RDC checks, gathered once for all alignments.
+        rdc_interatoms = []
+        for interatom in interatomic_loop(self._domain_moving()):
+            # Get the spins.
+            spin1 = return_spin(interatom.spin_id1)
+            spin2 = return_spin(interatom.spin_id2)
+
+            # RDC checks.
+            if self._check_rdcs(interatom, spin1, spin2):
+                rdc_interatoms.append(interatom)
+
         # The RDC data.
         for i in range(len(cdp.align_ids)):
             # The alignment ID.
             align_id = cdp.align_ids[i]
 
-            # Data flags
-            rdc_flag = False
-            if hasattr(cdp, 'rdc_ids') and align_id in cdp.rdc_ids:
-                rdc_flag = True
-            pcs_flag = False
+            # Spins with PCS data.
             if hasattr(cdp, 'pcs_ids') and align_id in cdp.pcs_ids:
-                pcs_flag = True
-
-            # Spin loop over the domain.
-            pcs_index = 0
-            for spin in spin_loop(self._domain_moving()):
-                # Skip deselected spins.
-                if not spin.select:
-                    continue
+                for pcs_index in range(len(pcs_spins)):
+                    # Alias the spin.
+                    spin = pcs_spins[pcs_index]
 
-                # Spins with PCS data.
-                if pcs_flag and hasattr(spin, 'pcs'):
                     # Initialise the data structure.
                     if not hasattr(spin, 'pcs_bc'):
                         spin.pcs_bc = {}
@@ -1431,19 +1438,10 @@ class Frame_order(API_base, API_common):
                     # Store the back-calculated value (in ppm).
                     spin.pcs_bc[align_id] = target_fn.pcs_theta[i, pcs_index] * 1e6
 
-                    # Increment the index.
-                    pcs_index += 1
-
-            # Interatomic data container loop.
-            rdc_index = 0
-            for interatom in interatomic_loop(self._domain_moving()):
-                # Get the spins.
-                spin1 = return_spin(interatom.spin_id1)
-                spin2 = return_spin(interatom.spin_id2)
-
-                # RDC checks.
-                if not self._check_rdcs(interatom, spin1, spin2):
-                    continue
+            # Interatomic data containers with RDC data.
+            for rdc_index in range(len(rdc_interatoms)):
+                # Alias the interatomic data container.
+                interatom = rdc_interatoms[rdc_index]
 
                 # Initialise the data structure.
                 if not hasattr(interatom, 'rdc_bc'):
@@ -1452,9 +1450,6 @@ class Frame_order(API_base, API_common):
                 # Store the back-calculated value.
                 interatom.rdc_bc[align_id] = target_fn.rdc_theta[i, rdc_index]
 
-                # Increment the index.
-                rdc_index += 1
-
 
     def _target_fn_setup(self, sim_index=None, scaling=True):
         """Initialise the target function for optimisation or direct calculation.
@@ -33,33 +33,32 @@ from copy import deepcopy
 from math import acos, cos, pi
 from minfx.generic import generic_minimise
 from minfx.grid import grid
-from numpy import array, dot, float64, ones, zeros
-from numpy.linalg import inv, norm
+from numpy import array, asarray, cos as cos_vect, dot, float64, isfinite, isnan, ones, sin, zeros
+from numpy.linalg import norm
 from re import search
 from warnings import warn
 
 # relax module imports.
 import lib.arg_check
 from lib.errors import RelaxError, RelaxInfError, RelaxNaNError, RelaxNoModelError, RelaxNoValueError, RelaxSpinTypeError
-from lib.float import isNaN, isInf
-from lib.geometry.rotations import euler_to_R_zyz, two_vect_to_R
+from lib.geometry.rotations import two_vect_to_R
 from lib.io import open_write_file
 from lib.structure.cones import Iso_cone
 from lib.structure.represent.cone import cone_edge, stitch_cone_to_edge
 from lib.structure.internal.object import Internal
 from lib.warnings import RelaxWarning
 from pipe_control import align_tensor, pcs, pipes, rdc
-from pipe_control.align_tensor import opt_uses_align_data, opt_uses_tensor
+from pipe_control.align_tensor import opt_tensor_indices, opt_uses_align_data, opt_uses_tensor
 from pipe_control.interatomic import interatomic_loop
-from pipe_control.mol_res_spin import return_spin, spin_loop
+from pipe_control.mol_res_spin import spin_loop
 from pipe_control.pcs import return_pcs_data
 from pipe_control.rdc import check_rdcs, return_rdc_data
 from pipe_control.structure import geometric
 from pipe_control.structure.mass import centre_of_mass
 from specific_analyses.api_base import API_base
 from specific_analyses.api_common import API_common
-from specific_analyses.n_state_model.data import base_data_types, calc_ave_dist, num_data_points, tensor_loop
-from specific_analyses.n_state_model.parameters import assemble_param_vector, assemble_scaling_matrix, disassemble_param_vector, linear_constraints, param_model_index, param_num, update_model
+from specific_analyses.n_state_model.data import base_data_types, calc_ave_dists, num_data_points, tensor_loop
+from specific_analyses.n_state_model.parameters import PATTERN_ALPHA, PATTERN_BETA, PATTERN_BOND, PATTERN_GAMMA, PATTERN_PARAMAG, PATTERN_PROB, assemble_param_vector, assemble_scaling_matrix, disassemble_param_vector, linear_constraints, param_model_index, param_num, update_model
 from target_functions.n_state_model import N_state_opt
 from target_functions.potential import quad_pot
 from user_functions.data import Uf_tables; uf_tables = Uf_tables()
@@ -69,6 +68,19 @@ from user_functions.objects import Desc_container
 class N_state_model(API_base, API_common):
     """Class containing functions for the N-state model."""
 
+    # The alignment tensor elements used in the optimisation data structures.
+    _tensor_elements = ('Axx', 'Ayy', 'Axy', 'Axz', 'Ayz')
+
+    # The base data structure names (the data, back-calculated data, and errors) for each data type, and a flag specifying if the structures are dictionaries keyed by alignment ID.
+    _data_structs = {
+        'rdc': ('rdc', 'rdc_bc', 'rdc_err', True),
+        'noesy': ('noesy', 'noesy_bc', 'noesy_err', False),
+        'pcs': ('pcs', 'pcs_bc', 'pcs_err', True)
+    }
+
+    # The paramagnetic centre parameter names and their coordinate indices.
+    _paramag_indices = {'paramag_x': 0, 'paramag_y': 1, 'paramag_z': 2}
+
     def __init__(self):
         """Initialise the class by placing API_common methods into the API."""
 
@@ -83,6 +95,9 @@ class N_state_model(API_base, API_common):
         self.sim_return_selected = self._sim_return_selected_global
         self.test_grid_ops = self._test_grid_ops_general
 
+        # Flag for the back-calculation of the Monte Carlo data, so that calculate() is only called once within a base_data_loop() pass.
+        self._mc_bc_done = False
+
         # Set up the spin parameters.
         self.PARAMS.add('csa', scope='spin', units='ppm', desc='CSA value', py_type=float, grace_string='\\qCSA\\Q')
 
@@ -120,34 +135,43 @@ class N_state_model(API_base, API_common):
             cdp.CoM = centre_of_mass()
 
         # Calculate the vector between the pivot and CoM points.
-        cdp.pivot_CoM = array(cdp.CoM, float64) - array(cdp.pivot_point, float64)
+        cdp.pivot_CoM = asarray(cdp.CoM, float64) - asarray(cdp.pivot_point, float64)
 
         # Calculate the unit vector between the pivot and CoM points.
-        unit_vect = cdp.pivot_CoM / norm(cdp.pivot_CoM)
-
-        # Initilise some data structures.
-        R = zeros((3, 3), float64)
-        vectors = zeros((cdp.N, 3), float64)
-
-        # Loop over the N states.
-        for c in range(cdp.N):
-            # Generate the rotation matrix.
-            euler_to_R_zyz(cdp.alpha[c], cdp.beta[c], cdp.gamma[c], R)
-
-            # Rotate the unit vector.
-            vectors[c] = dot(R, unit_vect)
-
-            # Multiply by the probability.
-            vectors[c] = vectors[c] * cdp.probs[c]
-
-        # Average of the unit vectors.
-        cdp.ave_unit_pivot_CoM = sum(vectors)
+        pivot_CoM_len = norm(cdp.pivot_CoM)
+        unit_vect = cdp.pivot_CoM / pivot_CoM_len
+
+        # The Euler angle trig for all N states.
+        alpha = array(cdp.alpha[:cdp.N], float64)
+        beta = array(cdp.beta[:cdp.N], float64)
+        gamma = array(cdp.gamma[:cdp.N], float64)
+        sin_a, cos_a = sin(alpha), cos_vect(alpha)
+        sin_b, cos_b = sin(beta), cos_vect(beta)
+        sin_g, cos_g = sin(gamma), cos_vect(gamma)
+
+        # The z-y-z Euler angle rotation matrices of all states (see lib.geometry.rotations.euler_to_R_zyz()).
+        R = zeros((cdp.N, 3, 3), float64)
+        R[:, 0, 0] = -sin_a * sin_g  +  cos_a * cos_b * cos_g
+        R[:, 1, 0] =  sin_a * cos_g  +  cos_a * cos_b * sin_g
+        R[:, 2, 0] = -cos_a * sin_b
+        R[:, 0, 1] = -cos_a * sin_g  -  sin_a * cos_b * cos_g
+        R[:, 1, 1] =  cos_a * cos_g  -  sin_a * cos_b * sin_g
+        R[:, 2, 1] =  sin_a * sin_b
+        R[:, 0, 2] =  sin_b * cos_g
+        R[:, 1, 2] =  sin_b * sin_g
+        R[:, 2, 2] =  cos_b
+
+        # The probability weighted average rotation matrix.
+        R_ave = dot(array(cdp.probs[:cdp.N], float64), R.reshape(cdp.N, 9)).reshape(3, 3)
+
+        # Average of the rotated unit vectors.
+        cdp.ave_unit_pivot_CoM = dot(R_ave, unit_vect)
 
         # The length reduction.
         cdp.ave_pivot_CoM_red = norm(cdp.ave_unit_pivot_CoM)
 
         # The aveage pivot-CoM vector.
-        cdp.ave_pivot_CoM = norm(cdp.pivot_CoM) * cdp.ave_unit_pivot_CoM
+        cdp.ave_pivot_CoM = pivot_CoM_len * cdp.ave_unit_pivot_CoM
 
         # The full length rotated pivot-CoM vector.
         cdp.full_ave_pivot_CoM = cdp.ave_pivot_CoM / cdp.ave_pivot_CoM_red
@@ -158,7 +182,8 @@ class N_state_model(API_base, API_common):
 
         # The cone angle and order parameter for diffusion in an axially symmetric cone.
         cdp.theta_diff_in_cone = acos(2.*cdp.ave_pivot_CoM_red - 1.)
-        cdp.S_diff_in_cone = cos(cdp.theta_diff_in_cone) * (1 + cos(cdp.theta_diff_in_cone)) / 2.0
+        cos_theta = cos(cdp.theta_diff_in_cone)
+        cdp.S_diff_in_cone = cos_theta * (1 + cos_theta) / 2.0
 
         # Print out.
         print("\n%-40s %-20s" % ("Pivot point:", repr(cdp.pivot_point)))
@@ -209,6 +234,9 @@ class N_state_model(API_base, API_common):
         # The number of increments for the filling of the cone objects.
         inc = 20
 
+        # The length of the pivot-CoM vector, used to scale the cone.
+        pivot_CoM_len = norm(cdp.pivot_CoM)
+
         # The rotation matrix.
         R = zeros((3, 3), float64)
         two_vect_to_R(array([0, 0, 1], float64), cdp.ave_pivot_CoM/norm(cdp.ave_pivot_CoM), R)
@@ -242,13 +270,13 @@ class N_state_model(API_base, API_common):
         # Generate the cone outer edge.
         print("\nGenerating the cone outer edge.")
         cap_start_atom = mol.atom_num[-1]+1
-        cone_edge(mol=mol, cone=cone, res_name='CON', res_num=3, apex=cdp.pivot_point, R=R, scale=norm(cdp.pivot_CoM), inc=inc)
+        cone_edge(mol=mol, cone=cone, res_name='CON', res_num=3, apex=cdp.pivot_point, R=R, scale=pivot_CoM_len, inc=inc)
 
         # Generate the cone cap, and stitch it to the cone edge.
         if cone_type == 'diff in cone':
             print("\nGenerating the cone cap.")
             cone_start_atom = mol.atom_num[-1]+1
-            geometric.generate_vector_dist(mol=mol, res_name='CON', res_num=3, centre=cdp.pivot_point, R=R, limit_check=cone.limit_check, scale=norm(cdp.pivot_CoM), inc=inc)
+            geometric.generate_vector_dist(mol=mol, res_name='CON', res_num=3, centre=cdp.pivot_point, R=R, limit_check=cone.limit_check, scale=pivot_CoM_len, inc=inc)
             stitch_cone_to_edge(mol=mol, cone=cone, dome_start=cone_start_atom, edge_start=cap_start_atom+1, inc=inc)
 
         # Create the PDB file.
@@ -269,6 +297,18 @@ class N_state_model(API_base, API_common):
         if not hasattr(cdp, 'align_tensors'):
             return
 
+        # The spins with PCS data and the interatomic data containers with RDC data, in the order of the back calculated data structures.
+        pcs_spins = []
+        if hasattr(cdp, 'pcs_ids'):
+            for spin in spin_loop(skip_desel=True):
+                if hasattr(spin, 'pcs'):
+                    pcs_spins.append(spin)
+        rdc_interatoms = []
+        if hasattr(cdp, 'rdc_ids'):
+            for interatom in interatomic_loop():
+                if check_rdcs(interatom):
+                    rdc_interatoms.append(interatom)
+
         # Loop over each alignment.
         align_index = 0
         for i in range(len(cdp.align_ids)):
@@ -279,55 +319,29 @@ class N_state_model(API_base, API_common):
             # The alignment ID.
             align_id = cdp.align_ids[i]
 
-            # Data flags
-            rdc_flag = False
-            if hasattr(cdp, 'rdc_ids') and align_id in cdp.rdc_ids:
-                rdc_flag = True
-            pcs_flag = False
-            if hasattr(cdp, 'pcs_ids') and align_id in cdp.pcs_ids:
-                pcs_flag = True
-
-            # Spin loop.
-            pcs_index = 0
-            for spin in spin_loop():
-                # Skip deselected spins.
-                if not spin.select:
-                    continue
+            # Spins with PCS data.
+            if pcs_spins and align_id in cdp.pcs_ids:
+                # The back calculated PCSs (in ppm).
+                pcs_bc = model.deltaij_theta[align_index] * 1e6
 
-                # Spins with PCS data.
-                if pcs_flag and hasattr(spin, 'pcs'):
-                    # Initialise the data structure if necessary.
+                # Store the values, initialising the data structure if necessary.
+                for pcs_index in range(len(pcs_spins)):
+                    spin = pcs_spins[pcs_index]
                     if not hasattr(spin, 'pcs_bc'):
                         spin.pcs_bc = {}
+                    spin.pcs_bc[align_id] = pcs_bc[pcs_index]
 
-                    # Add the back calculated PCS (in ppm).
-                    spin.pcs_bc[align_id] = model.deltaij_theta[align_index, pcs_index] * 1e6
+            # Interatomic data containers with RDC data.
+            if rdc_interatoms and align_id in cdp.rdc_ids:
+                # The back calculated RDCs.
+                rdc_bc = model.rdc_theta[align_index]
 
-                    # Increment the data index if the spin container has data.
-                    pcs_index = pcs_index + 1
-
-            # Interatomic data container loop.
-            rdc_index = 0
-            for interatom in interatomic_loop():
-                # Get the spins.
-                spin1 = return_spin(interatom.spin_id1)
-                spin2 = return_spin(interatom.spin_id2)
-
-                # RDC checks.
-                if not check_rdcs(interatom):
-                    continue
-
-                # Containers with RDC data.
-                if rdc_flag and hasattr(interatom, 'rdc'):
-                    # Initialise the data structure if necessary.
+                # Store the values, initialising the data structure if necessary.
+                for rdc_index in range(len(rdc_interatoms)):
+                    interatom = rdc_interatoms[rdc_index]
                     if not hasattr(interatom, 'rdc_bc'):
                         interatom.rdc_bc = {}
-
-                    # Append the back calculated PCS.
-                    interatom.rdc_bc[align_id] = model.rdc_theta[align_index, rdc_index]
-
-                    # Increment the data index if the interatom container has data.
-                    rdc_index = rdc_index + 1
+                    interatom.rdc_bc[align_id] = rdc_bc[rdc_index]
 
             # Increment the alignment index (for the optimised tensors).
             align_index += 1
@@ -342,38 +356,32 @@ class N_state_model(API_base, API_common):
         @rtype:             numpy rank-3 array, numpy rank-1 array.
         """
 
-        # Initialise.
-        atomic_pos = []
-
         # Store the atomic positions.
-        for spin in spin_loop():
-            # Skip deselected spins.
-            if not spin.select:
-                continue
-
+        atomic_pos = []
+        for spin in spin_loop(skip_desel=True):
             # Only use spins with alignment/paramagnetic data.
             if not hasattr(spin, 'pcs') and not hasattr(spin, 'pre'):
                 continue
 
-            # The position list.
-            if type(spin.pos[0]) in [float, float64]:
-                atomic_pos.append([spin.pos])
-            else:
-                atomic_pos.append(spin.pos)
+            # The position array, adding the structure dimension for single positions.
+            pos = asarray(spin.pos, float64)
+            if pos.ndim == 1:
+                pos = pos.reshape(1, 3)
+            atomic_pos.append(pos)
 
         # Convert to numpy objects.
         atomic_pos = array(atomic_pos, float64)
 
-        # The paramagnetic centre.
+        # The paramagnetic centre (numpy arrays are used directly, as the target function does not modify them).
         if not hasattr(cdp, 'paramagnetic_centre'):
             paramag_centre = zeros(3, float64)
         elif sim_index != None and not cdp.paramag_centre_fixed:
-            if not hasattr(cdp, 'paramagnetic_centre_sim') or cdp.paramagnetic_centre_sim[sim_index] == None:
+            if not hasattr(cdp, 'paramagnetic_centre_sim') or cdp.paramagnetic_centre_sim[sim_index] is None:
                 paramag_centre = zeros(3, float64)
             else:
-                paramag_centre = array(cdp.paramagnetic_centre_sim[sim_index])
+                paramag_centre = asarray(cdp.paramagnetic_centre_sim[sim_index], float64)
         else:
-            paramag_centre = array(cdp.paramagnetic_centre)
+            paramag_centre = asarray(cdp.paramagnetic_centre, float64)
 
         # Return the data structures.
         return atomic_pos, paramag_centre
@@ -397,51 +405,36 @@ class N_state_model(API_base, API_common):
                             array)
         """
 
-        # Initialise.
-        n = len(cdp.align_tensors.reduction)
-        full_tensors = zeros(n*5, float64)
-        red_tensors  = zeros(n*5, float64)
-        red_err = ones(n*5, float64) * 1e-5
-        full_in_ref_frame = zeros(n, float64)
+        # The tensor element names.
+        names = self._tensor_elements
+        sim_names = [name+'_sim' for name in names]
+        err_names = [name+'_err' for name in names]
 
-        # Loop over the full tensors.
+        # Gather the full tensors and the reference frame flags.
+        full_tensors = []
+        full_in_ref_frame = []
         for i, tensor in tensor_loop(red=False):
-            # The full tensor.
-            full_tensors[5*i + 0] = tensor.Axx
-            full_tensors[5*i + 1] = tensor.Ayy
-            full_tensors[5*i + 2] = tensor.Axy
-            full_tensors[5*i + 3] = tensor.Axz
-            full_tensors[5*i + 4] = tensor.Ayz
-
-            # The full tensor corresponds to the frame of reference.
-            if cdp.ref_domain == tensor.domain:
-                full_in_ref_frame[i] = 1
-
-        # Loop over the reduced tensors.
+            full_tensors += [getattr(tensor, name) for name in names]
+            full_in_ref_frame.append(cdp.ref_domain == tensor.domain)
+
+        # Gather the reduced tensors (the simulation data if required) and their errors.
+        red_tensors = []
+        red_err = []
         for i, tensor in tensor_loop(red=True):
-            # The reduced tensor (simulation data).
             if sim_index != None:
-                red_tensors[5*i + 0] = tensor.Axx_sim[sim_index]
-                red_tensors[5*i + 1] = tensor.Ayy_sim[sim_index]
-                red_tensors[5*i + 2] = tensor.Axy_sim[sim_index]
-                red_tensors[5*i + 3] = tensor.Axz_sim[sim_index]
-                red_tensors[5*i + 4] = tensor.Ayz_sim[sim_index]
-
-            # The reduced tensor.
+                red_tensors += [getattr(tensor, name)[sim_index] for name in sim_names]
             else:
-                red_tensors[5*i + 0] = tensor.Axx
-                red_tensors[5*i + 1] = tensor.Ayy
-                red_tensors[5*i + 2] = tensor.Axy
-                red_tensors[5*i + 3] = tensor.Axz
-                red_tensors[5*i + 4] = tensor.Ayz
-
-            # The reduced tensor errors.
+                red_tensors += [getattr(tensor, name) for name in names]
             if hasattr(tensor, 'Axx_err'):
-                red_err[5*i + 0] = tensor.Axx_err
-                red_err[5*i + 1] = tensor.Ayy_err
-                red_err[5*i + 2] = tensor.Axy_err
-                red_err[5*i + 3] = tensor.Axz_err
-                red_err[5*i + 4] = tensor.Ayz_err
+                red_err += [getattr(tensor, name) for name in err_names]
+            else:
+                red_err += [1e-5] * 5
+
+        # Convert to numpy arrays.
+        full_tensors = array(full_tensors, float64)
+        red_tensors = array(red_tensors, float64)
+        red_err = array(red_err, float64)
+        full_in_ref_frame = array(full_in_ref_frame, float64)
 
         # Return the data structures.
         return full_tensors, red_tensors, red_err, full_in_ref_frame
@@ -470,11 +463,8 @@ class N_state_model(API_base, API_common):
                 continue
 
             # The real tensors.
-            tensors[5*index + 0] = cdp.align_tensors[i].Axx
-            tensors[5*index + 1] = cdp.align_tensors[i].Ayy
-            tensors[5*index + 2] = cdp.align_tensors[i].Axy
-            tensors[5*index + 3] = cdp.align_tensors[i].Axz
-            tensors[5*index + 4] = cdp.align_tensors[i].Ayz
+            tensor = cdp.align_tensors[i]
+            tensors[5*index:5*index+5] = [getattr(tensor, name) for name in self._tensor_elements]
 
             # Increment the index.
             index += 1
@@ -509,12 +499,12 @@ class N_state_model(API_base, API_common):
         # Update the model parameters if necessary.
         update_model()
 
-        # Create the initial parameter vector.
-        param_vector = assemble_param_vector(sim_index=sim_index)
-
         # Determine if alignment tensors or RDCs are to be used.
         data_types = base_data_types()
 
+        # Create the initial parameter vector.
+        param_vector = assemble_param_vector(sim_index=sim_index)
+
         # The probabilities.
         probs = None
         if hasattr(cdp, 'probs') and len(cdp.probs) and cdp.probs[0] != None:
@@ -524,7 +514,7 @@ class N_state_model(API_base, API_common):
         scaling_matrix = None
         if len(param_vector):
             scaling_matrix = assemble_scaling_matrix(data_types=data_types, scaling=scaling)
-            param_vector = dot(inv(scaling_matrix), param_vector)
+            param_vector = param_vector / scaling_matrix.diagonal()
 
         # Get the data structures for optimisation using the tensors as base data sets.
         full_tensors, red_tensor_elem, red_tensor_err, full_in_ref_frame = None, None, None, None
@@ -579,63 +569,40 @@ class N_state_model(API_base, API_common):
 
         This loop iterates for each data point (RDC, PCS, NOESY) for each spin or interatomic data container, returning the identification information.
 
-        @return:            A list of the spin or interatomic data container, the data type ('rdc', 'pcs', 'noesy'), and the alignment ID if required.
-        @rtype:             list of [SpinContainer instance, str, str] or [InteratomContainer instance, str, str]
+        @return:            A tuple of the spin or interatomic data container, the data type ('rdc', 'pcs', 'noesy'), and the alignment ID if required.
+        @rtype:             tuple of (SpinContainer instance, str, str) or (InteratomContainer instance, str, str)
         """
 
-        # Loop over the interatomic data containers.
-        for interatom in interatomic_loop():
-            # Skip deselected data.
-            if not interatom.select:
-                continue
-
-            # Re-initialise the data structure.
-            data = [interatom, None, None]
+        # Reset the Monte Carlo back-calculation flag for this pass.
+        self._mc_bc_done = False
 
-            # RDC data.
-            if hasattr(interatom, 'rdc'):
-                data[1] = 'rdc'
-
-                # Loop over the alignment IDs.
-                for id in cdp.rdc_ids:
-                    # Add the ID.
-                    data[2] = id
-
-                    # Yield the set.
-                    yield data
-
-            # NOESY data.
-            if hasattr(interatom, 'noesy'):
-                data[1] = 'noesy'
-
-                # Loop over the alignment IDs.
-                for id in cdp.noesy_ids:
-                    # Add the ID.
-                    data[2] = id
-
-                    # Yield the set.
-                    yield data
-
-        # Loop over the spins.
-        for spin in spin_loop():
-            # Skip deselected data.
-            if not spin.select:
-                continue
+        # The flag is only valid within the pass, so it is reset again once the loop terminates.
+        try:
+            # Loop over the interatomic data containers.
+            for interatom in interatomic_loop():
+                # Skip deselected data.
+                if not interatom.select:
+                    continue
 
-            # Re-initialise the data structure.
-            data = [spin, None, None]
+                # RDC data, looping over the alignment IDs.
+                if hasattr(interatom, 'rdc'):
+                    for id in cdp.rdc_ids:
+                        yield interatom, 'rdc', id
 
-            # PCS data.
-            if hasattr(spin, 'pcs'):
-                data[1] = 'pcs'
+                # NOESY data, looping over the alignment IDs.
+                if hasattr(interatom, 'noesy'):
+                    for id in cdp.noesy_ids:
+                        yield interatom, 'noesy', id
 
-                # Loop over the alignment IDs.
-                for id in cdp.pcs_ids:
-                    # Add the ID.
-                    data[2] = id
+            # Loop over the spins.
+            for spin in spin_loop(skip_desel=True):
+                # PCS data, looping over the alignment IDs.
+                if hasattr(spin, 'pcs'):
+                    for id in cdp.pcs_ids:
+                        yield spin, 'pcs', id
 
-                    # Yield the set.
-                    yield data
+        finally:
+            self._mc_bc_done = False
 
 
     def calculate(self, spin_id=None, verbosity=1, sim_index=None):
@@ -676,31 +643,21 @@ class N_state_model(API_base, API_common):
 
         # NOE potential.
         if hasattr(cdp, 'noe_restraints'):
-            # Init some numpy arrays.
+            # Create arrays of the NOE bounds.
             num_restraints = len(cdp.noe_restraints)
-            dist = zeros(num_restraints, float64)
+            lower = array([restraint[2] for restraint in cdp.noe_restraints], float64)
+            upper = array([restraint[3] for restraint in cdp.noe_restraints], float64)
             pot = zeros(num_restraints, float64)
-            lower = zeros(num_restraints, float64)
-            upper = zeros(num_restraints, float64)
 
-            # Loop over the NOEs.
-            for i in range(num_restraints):
-                # Create arrays of the NOEs.
-                lower[i] = cdp.noe_restraints[i][2]
-                upper[i] = cdp.noe_restraints[i][3]
-
-                # Calculate the average distances, using -6 power averaging.
-                dist[i] = calc_ave_dist(cdp.noe_restraints[i][0], cdp.noe_restraints[i][1], exp=-6)
+            # Calculate the average distances, using -6 power averaging.
+            dist = calc_ave_dists([restraint[0] for restraint in cdp.noe_restraints], [restraint[1] for restraint in cdp.noe_restraints], exp=-6)
 
             # Calculate the quadratic potential.
             quad_pot(dist, pot, lower, upper)
 
-            # Store the distance and potential information.
-            cdp.ave_dist = []
-            cdp.quad_pot = []
-            for i in range(num_restraints):
-                cdp.ave_dist.append([cdp.noe_restraints[i][0], cdp.noe_restraints[i][1], dist[i]])
-                cdp.quad_pot.append([cdp.noe_restraints[i][0], cdp.noe_restraints[i][1], pot[i]])
+            # Store the distance and potential information (as Python floats, converted in one go).
+            cdp.ave_dist = [[restraint[0], restraint[1], value] for restraint, value in zip(cdp.noe_restraints, dist.tolist())]
+            cdp.quad_pot = [[restraint[0], restraint[1], value] for restraint, value in zip(cdp.noe_restraints, pot.tolist())]
 
 
     def create_mc_data(self, data_id=None):
@@ -712,53 +669,28 @@ class N_state_model(API_base, API_common):
         @rtype:             list of floats
         """
 
-        # Initialise the MC data structure.
-        mc_data = []
-
-        # Alias the spin or interatomic data container.
-        container = data_id[0]
-
-        # RDC data.
-        if data_id[1] == 'rdc' and hasattr(container, 'rdc'):
-            # Does back-calculated data exist?
-            if not hasattr(container, 'rdc_bc'):
-                self.calculate()
-
-            # The data.
-            if not hasattr(container, 'rdc_bc') or not data_id[2] in container.rdc_bc:
-                data = None
-            else:
-                data = container.rdc_bc[data_id[2]]
-
-            # Append the data.
-            mc_data.append(data)
-
-        # NOESY data.
-        elif data_id[1] == 'noesy' and hasattr(container, 'noesy'):
-            # Does back-calculated data exist?
-            if not hasattr(container, 'noesy_bc'):
-                self.calculate()
+        # Alias the spin or interatomic data container, data type and alignment ID.
+        container, data_type, align_id = data_id
 
-            # Append the data.
-            mc_data.append(container.noesy_bc)
+        # The data structure names.
+        names = self._data_structs.get(data_type)
 
-        # PCS data.
-        elif data_id[1] == 'pcs' and hasattr(container, 'pcs'):
-            # Does back-calculated data exist?
-            if not hasattr(container, 'pcs_bc'):
-                self.calculate()
+        # No data.
+        if names == None or not hasattr(container, names[0]):
+            return []
 
-            # The data.
-            if not hasattr(container, 'pcs_bc') or not data_id[2] in container.pcs_bc:
-                data = None
-            else:
-                data = container.pcs_bc[data_id[2]]
+        # Does back-calculated data exist (the calculation is only performed once per loop)?
+        if not hasattr(container, names[1]) and not self._mc_bc_done:
+            self.calculate()
+            self._mc_bc_done = True
 
-            # Append the data.
-            mc_data.append(data)
+        # The data.
+        data = getattr(container, names[1], None)
+        if names[3] and data != None:
+            data = data.get(align_id)
 
         # Return the data.
-        return mc_data
+        return [data]
 
 
     default_value_doc = Desc_container("N-state model default values")
@@ -816,8 +748,11 @@ class N_state_model(API_base, API_common):
         if not hasattr(cdp, 'model'):
             raise RelaxNoModelError('N-state')
 
+        # Determine the data type.
+        data_types = base_data_types()
+
         # The number of parameters.
-        n = param_num()
+        n = param_num(data_types=data_types)
 
         # Make sure that the length of the parameter array is > 0.
         if n == 0:
@@ -833,39 +768,31 @@ class N_state_model(API_base, API_common):
 
         # Setup the default bounds.
         if not lower:
-            # Init.
-            lower = []
-            upper = []
-
-            # Loop over the parameters.
-            for i in range(n):
-                # i is in the parameter array.
-                if i < len(cdp.params):
-                    # Probabilities (default values).
-                    if search('^p', cdp.params[i]):
-                        lower.append(0.0)
-                        upper.append(1.0)
-
-                    # Angles (default values).
-                    if search('^alpha', cdp.params[i]) or search('^gamma', cdp.params[i]):
-                        lower.append(0.0)
-                        upper.append(2*pi)
-                    elif search('^beta', cdp.params[i]):
-                        lower.append(0.0)
-                        upper.append(pi)
-
-                # The paramagnetic centre.
-                elif hasattr(cdp, 'paramag_centre_fixed') and not cdp.paramag_centre_fixed and (n - i) <= 3:
-                    lower.append(-100)
-                    upper.append(100)
-
-                # Otherwise this must be an alignment tensor component.
-                else:
-                    lower.append(-1e-3)
-                    upper.append(1e-3)
-
-        # Determine the data type.
-        data_types = base_data_types()
+            # Init (the alignment tensor component default values).
+            lower = -1e-3 * ones(n, float64)
+            upper = 1e-3 * ones(n, float64)
+
+            # The model parameters (all with a lower bound of zero).
+            num = min(n, len(cdp.params))
+            lower[:num] = 0.0
+
+            # Classify the model parameters.
+            for i in range(num):
+                # Probabilities (default values).
+                if PATTERN_PROB.match(cdp.params[i]):
+                    upper[i] = 1.0
+
+                # Angles (default values).
+                elif PATTERN_ALPHA.match(cdp.params[i]) or PATTERN_GAMMA.match(cdp.params[i]):
+                    upper[i] = 2*pi
+                elif PATTERN_BETA.match(cdp.params[i]):
+                    upper[i] = pi
+
+            # The paramagnetic centre (the last 3 parameters).
+            if hasattr(cdp, 'paramag_centre_fixed') and not cdp.paramag_centre_fixed:
+                start = max(num, n-3)
+                lower[start:] = -100
+                upper[start:] = 100
 
         # The number of tensors to optimise.
         tensor_num = align_tensor.num_tensors(skip_fixed=True)
@@ -875,29 +802,24 @@ class N_state_model(API_base, API_common):
             # Print out.
             print("Optimising each alignment tensor separately.")
 
-            # Store the alignment tensor fixed flags.
-            fixed_flags = []
-            for i in range(len(cdp.align_ids)):
-                # Get the tensor object.
-                tensor = align_tensor.return_tensor(index=i, skip_fixed=False)
+            # A snapshot of the alignment tensor objects for all sub-grids (without skipping the fixed tensors, return_tensor() is simply list indexing).
+            tensors = cdp.align_tensors[:len(cdp.align_ids)]
 
-                # Store the flag.
-                fixed_flags.append(tensor.fixed)
+            # Store the alignment tensor fixed flags.
+            fixed_flags = [tensor.fixed for tensor in tensors]
 
-                # Fix the tensor.
+            # Fix all tensors.
+            for tensor in tensors:
                 tensor.set('fixed', True)
 
             # Loop over each sub-grid.
-            for i in range(len(cdp.align_ids)):
+            for i in range(len(tensors)):
                 # Skip the tensor if originally fixed.
                 if fixed_flags[i]:
                     continue
 
-                # Get the tensor object.
-                tensor = align_tensor.return_tensor(index=i, skip_fixed=False)
-
                 # Unfix the current tensor.
-                tensor.set('fixed', False)
+                tensors[i].set('fixed', False)
 
                 # Grid search parameter subsets.
                 lower_sub = lower[i*5:i*5+5]
@@ -908,15 +830,11 @@ class N_state_model(API_base, API_common):
                 self.minimise(min_algor='grid', lower=lower_sub, upper=upper_sub, inc=inc_sub, constraints=constraints, verbosity=verbosity, sim_index=sim_index)
 
                 # Fix the tensor again.
-                tensor.set('fixed', True)
+                tensors[i].set('fixed', True)
 
             # Reset the state of the tensors.
-            for i in range(len(cdp.align_ids)):
-                # Get the tensor object.
-                tensor = align_tensor.return_tensor(index=i, skip_fixed=False)
-
-                # Fix the tensor.
-                tensor.set('fixed', fixed_flags[i])
+            for i in range(len(tensors)):
+                tensors[i].set('fixed', fixed_flags[i])
 
         # All other minimisation.
         else:
@@ -952,7 +870,7 @@ class N_state_model(API_base, API_common):
         """
 
         # Paramagnetic centre.
-        if search('^paramag_[xyz]$', param):
+        if PATTERN_PARAMAG.match(param):
             return [-100.0, 100.0]
 
 
@@ -1027,9 +945,9 @@ class N_state_model(API_base, API_common):
         if search('^[Gg]rid', min_algor):
             # Scaling.
             if scaling:
-                for i in range(len(param_vector)):
-                    lower[i] = lower[i] / scaling_matrix[i, i]
-                    upper[i] = upper[i] / scaling_matrix[i, i]
+                diag = scaling_matrix.diagonal()
+                lower = array(lower, float64) / diag
+                upper = array(upper, float64) / diag
 
             # The search.
             results = grid(func=model.func, args=(), num_incs=inc, lower=lower, upper=upper, A=A, b=b, verbosity=verbosity)
@@ -1049,20 +967,19 @@ class N_state_model(API_base, API_common):
                 return
             param_vector, func, iter_count, f_count, g_count, h_count, warning = results
 
-        # Catch infinite chi-squared values.
-        if isInf(func):
+        # Catch infinite chi-squared values and chi-squared values of NaN.
+        if not isfinite(func):
+            if isnan(func):
+                raise RelaxNaNError('chi-squared')
             raise RelaxInfError('chi-squared')
 
-        # Catch chi-squared values of NaN.
-        if isNaN(func):
-            raise RelaxNaNError('chi-squared')
-
-        # Make a last function call to update the back-calculated RDC and PCS structures to the optimal values.
-        chi2 = model.func(param_vector)
+        # Make a last function call to update the back-calculated RDC and PCS structures to the optimal values (these are only used in the statistical analysis below, so this is skipped for the Monte Carlo simulations).
+        if sim_index == None and ('rdc' in data_types or 'pcs' in data_types):
+            model.func(param_vector)
 
         # Scaling.
         if scaling:
-            param_vector = dot(scaling_matrix, param_vector)
+            param_vector = param_vector * scaling_matrix.diagonal()
 
         # Disassemble the parameter vector.
         disassemble_param_vector(param_vector=param_vector, data_types=data_types, sim_index=sim_index)
@@ -1139,8 +1056,11 @@ class N_state_model(API_base, API_common):
         @rtype:                 tuple of (int, int, float)
         """
 
+        # Determine the data type once for both counts.
+        data_types = base_data_types()
+
         # Return the values.
-        return param_num(), num_data_points(), cdp.chi2
+        return param_num(data_types=data_types), num_data_points(data_types=data_types), cdp.chi2
 
 
     def return_data(self, data_id):
@@ -1153,37 +1073,26 @@ class N_state_model(API_base, API_common):
         """
 
         # Alias the spin or interatomic data container, data type and alignment ID.
-        container = data_id[0]
-        data_type = data_id[1]
-        align_id = data_id[2]
-
-        # The data structure to return.
-        data = []
+        container, data_type, align_id = data_id
 
         # Skip deselected spins.
-        if data_id[1] == 'pcs' and not container.select:
+        if data_type == 'pcs' and not container.select:
             return
 
-        # Return the RDC data.
-        if data_type == 'rdc' and hasattr(container, 'rdc'):
-            if align_id not in container.rdc:
-                data.append(None)
-            else:
-                data.append(container.rdc[align_id])
+        # The data structure names.
+        names = self._data_structs.get(data_type)
 
-        # Return the NOESY data.
-        elif data_type == 'noesy' and hasattr(container, 'noesy'):
-            data.append(container.noesy)
+        # No data.
+        if names == None or not hasattr(container, names[0]):
+            return []
 
-        # Return the PCS data.
-        elif data_id[1] == 'pcs' and hasattr(container, 'pcs'):
-            if align_id not in container.pcs:
-                data.append(None)
-            else:
-                data.append(container.pcs[align_id])
+        # The data.
+        data = getattr(container, names[0])
+        if names[3]:
+            data = data.get(align_id)
 
         # Return the data.
-        return data
+        return [data]
 
 
     return_data_name_doc = Desc_container("N-state model data type string matching patterns")
@@ -1209,23 +1118,23 @@ class N_state_model(API_base, API_common):
         """
 
         # Probability.
-        if search('^p[0-9]*$', param):
+        if PATTERN_PROB.match(param):
             return 'probs'
 
         # Alpha Euler angle.
-        if search('^alpha', param):
+        if PATTERN_ALPHA.match(param):
             return 'alpha'
 
         # Beta Euler angle.
-        if search('^beta', param):
+        if PATTERN_BETA.match(param):
             return 'beta'
 
         # Gamma Euler angle.
-        if search('^gamma', param):
+        if PATTERN_GAMMA.match(param):
             return 'gamma'
 
         # Bond length.
-        if search('^r$', param) or search('[Bb]ond[ -_][Ll]ength', param):
+        if PATTERN_BOND.search(param):
             return 'r'
 
         # Heteronucleus type.
@@ -1237,7 +1146,7 @@ class N_state_model(API_base, API_common):
             return 'proton_type'
 
         # Paramagnetic centre.
-        if search('^paramag_[xyz]$', param):
+        if PATTERN_PARAMAG.match(param):
             return param
 
 
@@ -1250,57 +1159,33 @@ class N_state_model(API_base, API_common):
         @rtype:             list of float
         """
 
-        # Initialise the MC data structure.
-        mc_errors = []
-
-        # Alias the spin or interatomic data container.
-        container = data_id[0]
+        # Alias the spin or interatomic data container, data type and alignment ID.
+        container, data_type, align_id = data_id
 
         # Skip deselected spins.
-        if data_id[1] == 'pcs' and not container.select:
+        if data_type == 'pcs' and not container.select:
             return
 
-        # RDC data.
-        if data_id[1] == 'rdc' and hasattr(container, 'rdc'):
-            # Do errors exist?
-            if not hasattr(container, 'rdc_err'):
-                raise RelaxError("The RDC errors are missing for the spin pair '%s' and '%s'." % (container.spin_id1, container.spin_id2))
+        # The data structure names.
+        names = self._data_structs.get(data_type)
 
-            # The error.
-            if data_id[2] not in container.rdc_err:
-                err = None
-            else:
-                err = container.rdc_err[data_id[2]]
+        # No data.
+        if names == None or not hasattr(container, names[0]):
+            return []
 
-            # Append the data.
-            mc_errors.append(err)
+        # Do errors exist?
+        if not hasattr(container, names[2]):
+            if data_type == 'pcs':
+                raise RelaxError("The PCS errors are missing for spin '%s'." % container)
+            raise RelaxError("The %s errors are missing for the spin pair '%s' and '%s'." % (data_type.upper(), container.spin_id1, container.spin_id2))
 
-        # NOESY data.
-        elif data_id[1] == 'noesy' and hasattr(container, 'noesy'):
-            # Do errors exist?
-            if not hasattr(container, 'noesy_err'):
-                raise RelaxError("The NOESY errors are missing for the spin pair '%s' and '%s'." % (container.spin_id1, container.spin_id2))
-
-            # Append the data.
-            mc_errors.append(container.noesy_err)
-
-        # PCS data.
-        elif data_id[1] == 'pcs' and hasattr(container, 'pcs'):
-            # Do errors exist?
-            if not hasattr(container, 'pcs_err'):
-                raise RelaxError("The PCS errors are missing for spin '%s'." % data_id[0])
-
-            # The error.
-            if data_id[2] not in container.pcs_err:
-                err = None
-            else:
-                err = container.pcs_err[data_id[2]]
-
-            # Append the data.
-            mc_errors.append(err)
+        # The error.
+        err = getattr(container, names[2])
+        if names[3]:
+            err = err.get(align_id)
 
         # Return the errors.
-        return mc_errors
+        return [err]
 
 
     def return_grace_string(self, param):
@@ -1365,13 +1250,12 @@ class N_state_model(API_base, API_common):
         """
 
         # Align parameters.
-        names = ['Axx', 'Ayy', 'Axy', 'Axz', 'Ayz']
+        names = self._tensor_elements
 
         # Alignment tensor parameters.
         if index < len(cdp.align_ids)*5:
             # The tensor and parameter index.
-            param_index = index % 5
-            tensor_index = (index - index % 5) / 5
+            tensor_index, param_index = divmod(index, 5)
 
             # Set the error.
             tensor = align_tensor.return_tensor(index=tensor_index, skip_fixed=True)
@@ -1414,7 +1298,7 @@ class N_state_model(API_base, API_common):
                 obj_name += '_err'
 
             # Set the indexed parameter.
-            if obj_name in ['probs', 'alpha', 'beta', 'gamma']:
+            if obj_name in ('probs', 'alpha', 'beta', 'gamma'):
                 # The index.
                 index = param_model_index(param[i])
 
@@ -1423,21 +1307,13 @@ class N_state_model(API_base, API_common):
                 obj[index] = value[i]
 
             # The paramagnetic centre.
-            if search('^paramag_[xyz]$', obj_name):
+            elif obj_name in self._paramag_indices:
                 # Init.
                 if not hasattr(cdp, 'paramagnetic_centre'):
                     cdp.paramagnetic_centre = zeros(3, float64)
 
-                # Set the coordinate.
-                if obj_name == 'paramag_x':
-                    index = 0
-                elif obj_name == 'paramag_y':
-                    index = 1
-                else:
-                    index = 2
-
                 # Set the value in Angstrom.
-                cdp.paramagnetic_centre[index] = value[i]
+                cdp.paramagnetic_centre[self._paramag_indices[obj_name]] = value[i]
 
             # Set the spin parameters.
             else:
@@ -1461,18 +1337,15 @@ class N_state_model(API_base, API_common):
             names = ['Axx', 'Ayy', 'Axy', 'Axz', 'Ayz']
 
             # Loop over the alignments, adding the alignment tensor parameters to the tensor data container.
-            for i in range(len(cdp.align_tensors)):
-                # Skip non-optimised tensors.
-                if not opt_uses_tensor(cdp.align_tensors[i]):
-                    continue
-
+            for i in opt_tensor_indices():
                 # Set up the number of simulations.
                 cdp.align_tensors[i].set_sim_num(cdp.sim_number)
 
-                # Loop over all the parameter names, setting the initial simulation values to those of the parameter value.
+                # Loop over all the parameter names, setting the initial simulation values to those of the parameter value (these are floats, so no copy is needed).
                 for object_name in names:
+                    value = getattr(cdp.align_tensors[i], object_name)
                     for j in range(cdp.sim_number):
-                        cdp.align_tensors[i].set(param=object_name, value=deepcopy(getattr(cdp.align_tensors[i], object_name)), category='sim', sim_index=j)
+                        cdp.align_tensors[i].set(param=object_name, value=value, category='sim', sim_index=j)
 
             # Create all other simulation objects.
             for object_name in sim_names:
@@ -1550,13 +1423,12 @@ class N_state_model(API_base, API_common):
         """
 
         # Align parameters.
-        names = ['Axx', 'Ayy', 'Axy', 'Axz', 'Ayz']
+        names = self._tensor_elements
 
         # Alignment tensor parameters.
         if index < align_tensor.num_tensors(skip_fixed=True)*5:
             # The tensor and parameter index.
-            param_index = index % 5
-            tensor_index = (index - index % 5) / 5
+            tensor_index, param_index = divmod(index, 5)
 
             # Return the simulation parameter array.
             tensor = align_tensor.return_tensor(index=tensor_index, skip_fixed=True)
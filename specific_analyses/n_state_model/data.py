@@ -24,7 +24,7 @@
 
 # Python module imports.
 from math import pi, sqrt
-from numpy.linalg import norm
+from numpy import array, asarray, float64, zeros
 from warnings import warn
 
 # relax module imports.
@@ -109,58 +109,97 @@ def calc_ave_dist(atom1, atom2, exp=1):
     @rtype:         float
     """
 
-    # Get the spin containers.
-    spin1 = return_spin(atom1)
-    spin2 = return_spin(atom2)
+    # Use the multiple atom pair function (this single pair function is no longer used by relax itself, but is kept as part of the public API).
+    return float(calc_ave_dists([atom1], [atom2], exp=exp)[0])
 
-    # Loop over each model.
-    num_models = len(spin1.pos)
-    ave_dist = 0.0
-    for i in range(num_models):
-        # Distance to the minus sixth power.
-        dist = norm(spin1.pos[i] - spin2.pos[i])
-        ave_dist = ave_dist + dist**(exp)
 
-    # Average.
-    ave_dist = ave_dist / num_models
+def calc_ave_dists(atoms1, atoms2, exp=1):
+    """Calculate the average distances for a set of atom pairs.
+
+    This is the same calculation as that of calc_ave_dist(), but for all atom pairs at once.  Atoms with a single position (a rank-1 array) use this position for all structural models.
+
+
+    @param atoms1:  The atom identification strings of the first atom of each pair.
+    @type atoms1:   list of str
+    @param atoms2:  The atom identification strings of the second atom of each pair.
+    @type atoms2:   list of str
+    @keyword exp:   The exponent used for the averaging, e.g. 1 for linear averaging and -6 for
+                    r^-6 NOE averaging.
+    @type exp:      int
+    @return:        The average distances between the atom pairs.
+    @rtype:         numpy rank-1 array
+    """
+
+    # No atom pairs.
+    if not len(atoms1):
+        return zeros(0, float64)
+
+    # The atomic positions as (models, 3) arrays, as single positions (e.g. from loading averaged positions) are rank-1.
+    pos1 = [asarray(return_spin(atom).pos, float64).reshape(-1, 3) for atom in atoms1]
+    pos2 = [asarray(return_spin(atom).pos, float64).reshape(-1, 3) for atom in atoms2]
+
+    # The number of structural models.
+    num_models = max([len(pos) for pos in pos1 + pos2])
+
+    # Use single positions for all models.
+    for atoms, positions in [[atoms1, pos1], [atoms2, pos2]]:
+        for i in range(len(positions)):
+            # The correct number of models.
+            if len(positions[i]) == num_models:
+                continue
+
+            # Mismatch.
+            if len(positions[i]) != 1:
+                raise RelaxError("The %s positions of the atom '%s' do not match the %s structural models." % (len(positions[i]), atoms[i], num_models))
+
+            # Replicate the position.
+            positions[i] = positions[i].repeat(num_models, axis=0)
+
+    # Convert to arrays (the first index is the atom pair, the second the structural model).
+    pos1 = array(pos1)
+    pos2 = array(pos2)
+
+    # The squared distances for each model.
+    diff = pos1 - pos2
+    dist2 = (diff**2).sum(axis=-1)
+
+    # Average of the distances to the given power over the models (avoiding the square root).
+    ave_dist = (dist2**(0.5*exp)).sum(axis=1) / dist2.shape[1]
 
     # The exponent.
     ave_dist = ave_dist**(1.0/exp)
 
-    # Return the average distance.
+    # Return the average distances.
     return ave_dist
 
 
-def num_data_points():
+def num_data_points(data_types=None):
     """Determine the number of data points used in the model.
 
-    @return:    The number, n, of data points in the model.
-    @rtype:     int
+    @keyword data_types:    The base data types used in the optimisation.  If not supplied, these will be determined via base_data_types().
+    @type data_types:       None or list of str
+    @return:                The number, n, of data points in the model.
+    @rtype:                 int
     """
 
     # Determine the data type.
-    data_types = base_data_types()
+    if data_types == None:
+        data_types = base_data_types()
 
     # Init.
     n = 0
 
-    # Spin loop.
-    for spin in spin_loop():
-        # Skip deselected spins.
-        if not spin.select:
-            continue
-
-        # PCS data (skipping array elements set to None).
-        if 'pcs' in data_types:
+    # PCS data, looping over the selected spins (skipping array elements set to None).
+    if 'pcs' in data_types:
+        for spin in spin_loop(skip_desel=True):
             if hasattr(spin, 'pcs'):
                 for pcs in spin.pcs:
                     if isinstance(pcs, float):
                         n = n + 1
 
-    # Interatomic data loop.
-    for interatom in interatomic_loop():
-        # RDC data (skipping array elements set to None).
-        if 'rdc' in data_types:
+    # RDC data, looping over the interatomic data containers (skipping array elements set to None).
+    if 'rdc' in data_types:
+        for interatom in interatomic_loop():
             if hasattr(interatom, 'rdc'):
                 for rdc in interatom.rdc:
                     if isinstance(rdc, float):
@@ -24,16 +24,24 @@
 
 # Python module imports.
 from numpy import array, float64, identity, zeros
-from re import search
+from re import compile
 from warnings import warn
 
 # relax module imports.
 from lib.errors import RelaxNoModelError
 from lib.warnings import RelaxWarning
 from pipe_control import align_tensor, pipes
-from pipe_control.align_tensor import opt_uses_align_data, opt_uses_tensor
+from pipe_control.align_tensor import opt_tensor_indices, opt_uses_align_data
 from specific_analyses.n_state_model.data import base_data_types
 
+# The compiled parameter name patterns.
+PATTERN_PROB = compile('^p[0-9]*$')
+PATTERN_ALPHA = compile('^alpha')
+PATTERN_BETA = compile('^beta')
+PATTERN_GAMMA = compile('^gamma')
+PATTERN_BOND = compile('^r$|[Bb]ond[ -_][Ll]ength')
+PATTERN_PARAMAG = compile('^paramag_[xyz]$')
+
 
 def assemble_param_vector(sim_index=None):
     """Assemble all the parameters of the model into a single array.
@@ -48,21 +56,14 @@ def assemble_param_vector(sim_index=None):
     if not hasattr(cdp, 'model') or not isinstance(cdp.model, str):
         raise RelaxNoModelError
 
-    # Determine the data type.
-    data_types = base_data_types()
-
     # Initialise the parameter vector.
     param_vector = []
 
     # A RDC or PCS data type requires the alignment tensors to be at the start of the parameter vector (unless the tensors are fixed).
     if opt_uses_align_data():
-        for i in range(len(cdp.align_tensors)):
-            # Skip non-optimised tensors.
-            if not opt_uses_tensor(cdp.align_tensors[i]):
-                continue
-
+        for i in opt_tensor_indices():
             # Add the parameters.
-            param_vector = param_vector + list(cdp.align_tensors[i].A_5D)
+            param_vector.extend(cdp.align_tensors[i].A_5D)
 
     # Monte Carlo simulation data structures.
     if sim_index != None:
@@ -90,7 +91,7 @@ def assemble_param_vector(sim_index=None):
 
     # The probabilities (exclude that of state N).
     if cdp.model in ['2-domain', 'population']:
-        param_vector = param_vector + probs[0:-1]
+        param_vector.extend(probs[0:-1])
 
     # The Euler angles.
     if cdp.model == '2-domain':
@@ -148,11 +149,7 @@ def assemble_scaling_matrix(data_types=None, scaling=True):
 
     # Loop over the alignments.
     tensor_num = 0
-    for i in range(len(cdp.align_tensors)):
-        # Skip non-optimised tensors.
-        if not opt_uses_tensor(cdp.align_tensors[i]):
-            continue
-
+    for i in opt_tensor_indices():
         # Add the 5 alignment parameters.
         pop_start = pop_start + 5
 
@@ -199,11 +196,7 @@ def disassemble_param_vector(param_vector=None, data_types=None, sim_index=None)
     if ('rdc' in data_types or 'pcs' in data_types) and not align_tensor.all_tensors_fixed():
         # Loop over the alignments, adding the alignment tensor parameters to the tensor data container.
         tensor_num = 0
-        for i in range(len(cdp.align_tensors)):
-            # Skip non-optimised tensors.
-            if not opt_uses_tensor(cdp.align_tensors[i]):
-                continue
-
+        for i in opt_tensor_indices():
             # Normal tensors.
             if sim_index == None:
                 cdp.align_tensors[i].set(param='Axx', value=param_vector[5*tensor_num])
@@ -382,11 +375,7 @@ def linear_constraints(data_types=None, scaling_matrix=None):
     pop_start = 0
     if ('rdc' in data_types or 'pcs' in data_types) and not align_tensor.all_tensors_fixed():
         # Loop over the alignments.
-        for i in range(len(cdp.align_tensors)):
-            # Skip non-optimised tensors.
-            if not opt_uses_tensor(cdp.align_tensors[i]):
-                continue
-
+        for i in opt_tensor_indices():
             # Add 5 parameters.
             pop_start += 5
 
@@ -458,34 +447,37 @@ def param_model_index(param):
     """
 
     # Probability.
-    if search('^p[0-9]*$', param):
+    if PATTERN_PROB.match(param):
         return int(param[1:])
 
     # Alpha Euler angle.
-    if search('^alpha', param):
+    if PATTERN_ALPHA.match(param):
         return int(param[5:])
 
     # Beta Euler angle.
-    if search('^beta', param):
+    if PATTERN_BETA.match(param):
         return int(param[4:])
 
     # Gamma Euler angle.
-    if search('^gamma', param):
+    if PATTERN_GAMMA.match(param):
         return int(param[5:])
 
     # Model independent parameter.
     return None
 
 
-def param_num():
+def param_num(data_types=None):
     """Determine the number of parameters in the model.
 
-    @return:    The number of model parameters.
-    @rtype:     int
+    @keyword data_types:    The base data types used in the optimisation.  If not supplied, these will be determined via base_data_types().
+    @type data_types:       None or list of str
+    @return:                The number of model parameters.
+    @rtype:                 int
     """
 
     # Determine the data type.
-    data_types = base_data_types()
+    if data_types == None:
+        data_types = base_data_types()
 
     # Init.
     num = 0
@@ -493,11 +485,7 @@ def param_num():
     # Alignment tensor params.
     if ('rdc' in data_types or 'pcs' in data_types) and not align_tensor.all_tensors_fixed():
         # Loop over the alignments.
-        for i in range(len(cdp.align_tensors)):
-            # Skip non-optimised tensors.
-            if not opt_uses_tensor(cdp.align_tensors[i]):
-                continue
-
+        for i in opt_tensor_indices():
             # Add 5 tensor parameters.
             num += 5
 
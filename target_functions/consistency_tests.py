@@ -22,7 +22,7 @@
 
 # Python module imports.
 from math import cos, pi
-from numpy import float64, zeros
+from numpy import array, cos as cos_vect, float64, where, zeros
 
 # relax module imports.
 from lib.auto_relaxation.ri_comps import calc_fixed_csa, calc_fixed_dip, comp_csa_const_func, comp_dip_const_func
@@ -83,6 +83,10 @@ class Consistency:
         self.data.frq_list[0, 4] = frq + frqX
         self.data.frq_sqrd_list = self.data.frq_list ** 2
 
+        # Calculate the fixed component of the dipolar and CSA constants (these only depend on the values above).
+        calc_fixed_dip(self.data)
+        calc_fixed_csa(self.data)
+
 
     def calc_sigma_noe(self, noe, r1):
         """Function for calculating the sigma NOE value."""
@@ -96,10 +100,6 @@ class Consistency:
         Three values are returned, J(0), F_eta and F_R2.
         """
 
-        # Calculate the fixed component of the dipolar and CSA constants.
-        calc_fixed_dip(self.data)
-        calc_fixed_csa(self.data)
-
         # Calculate the dipolar and CSA constants.
         comp_dip_const_func(self.data, r)
         comp_csa_const_func(self.data, csa)
@@ -148,6 +148,48 @@ class Consistency:
         return j0, f_eta, f_r2
 
 
+    def func_vect(self, orientation=None, tc=None, r=None, csa=None, r1=None, r2=None, noe=None):
+        """Vectorised calculation of the three consistency testing values for multiple spins.
+
+        This is the same as the func() method, but all arguments are numpy arrays with one element per spin, and all spins must share the gyromagnetic ratios of this instance.  Three arrays are returned, J(0), F_eta and F_R2.
+        """
+
+        # Convert all arguments to float arrays.
+        orientation = array(orientation, float64)
+        tc = array(tc, float64)
+        r = array(r, float64)
+        csa = array(csa, float64)
+        r1 = array(r1, float64)
+        r2 = array(r2, float64)
+        noe = array(noe, float64)
+
+        # Calculate the dipolar and CSA constants (as in comp_dip_const_func() and comp_csa_const_func()).
+        safe_r = where(r == 0.0, 1.0, r)
+        d = where(r == 0.0, 1e99, 0.25 * self.data.dip_const_fixed * safe_r**-6)
+        c = self.data.csa_const_fixed[0] * csa**2
+
+        # Calculate the sigma NOE value.
+        sigma_noe = self.calc_sigma_noe(noe, r1)
+
+        # Calculate J(0) and J(wX).
+        j0 = -1.5 / (3.0*d + c) * (0.5*r1 - r2 + 0.6*sigma_noe)
+        jwx = 1.0 / (3.0*d + c) * (r1 - 1.4*sigma_noe)
+
+        # Calculate P_2.
+        p_2 = 0.5 * ((3.0 * (cos_vect(orientation * pi / 180)) ** 2) -1)
+
+        # Calculate eta and F_eta.
+        eta = ((d * c/3.0) ** 0.5) * (4.0 * j0 + 3.0 * jwx) * p_2
+        f_eta = eta * self.data.gh / (self.data.frq_list[0, 3] * (4.0 + 3.0 / (1 + (self.data.frq_list[0, 1] * tc) ** 2)))
+
+        # Calculate P_HF and F_R2.
+        p_hf = 1.3 * (self.data.gx / self.data.gh) * (1.0 - noe) * r1
+        f_r2 = (r2 - p_hf) / ((4.0 + 3.0 / (1 + (self.data.frq_list[0, 1] * tc) ** 2)) * (d + c/3.0))
+
+        # Return the three arrays.
+        return j0, f_eta, f_r2
+
+
 class Data:
     def __init__(self):
         """Empty container for storing data."""
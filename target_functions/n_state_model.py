@@ -21,12 +21,12 @@
 
 # Python module imports.
 from math import sqrt
-from numpy import array, dot, eye, float64, ones, rank, transpose, zeros
+from numpy import append, array, dot, eye, float64, ones, rank, transpose, zeros
 
 # relax module imports.
 from lib.alignment.alignment_tensor import dAi_dAxx, dAi_dAyy, dAi_dAxy, dAi_dAxz, dAi_dAyz, to_tensor
 from lib.alignment.paramag_centre import vectors_single_centre, vectors_centre_per_state
-from lib.alignment.pcs import ave_pcs_tensor, ave_pcs_tensor_ddeltaij_dAmn, ave_pcs_tensor_ddeltaij_dc, pcs_constant_grad, pcs_tensor
+from lib.alignment.pcs import ave_pcs_tensor_ddeltaij_dAmn, ave_pcs_tensor_ddeltaij_dc, pcs_constant_grad, pcs_tensor
 from lib.alignment.rdc import ave_rdc_tensor, ave_rdc_tensor_dDij_dAmn, ave_rdc_tensor_pseudoatom, ave_rdc_tensor_pseudoatom_dDij_dAmn, rdc_tensor
 from lib.errors import RelaxError
 from lib.float import isNaN
@@ -193,6 +193,10 @@ class N_state_opt:
         else:
             self.scaling_flag = False
 
+        # No scaling is required for the identity matrix.
+        if self.scaling_flag and (self.scaling_matrix == eye(len(self.scaling_matrix))).all():
+            self.scaling_flag = False
+
         # The 2-domain N-state model.
         if model == '2-domain':
             # Some checks.
@@ -666,6 +670,12 @@ class N_state_opt:
             self.paramag_centre = params[-3:]
             self.paramag_info()
 
+        # The weights of all N states for the PCS (the last probability is not part of the parameter vector).
+        if self.pcs_flag_sum:
+            weights = self.probs
+            if len(weights) < self.N:
+                weights = append(weights, 1.0 - weights.sum())
+
         # Loop over each alignment.
         index = 0
         for align_index in range(self.num_align):
@@ -695,11 +705,12 @@ class N_state_opt:
 
             # The back calculated PCS.
             if self.pcs_flag[align_index]:
-                # Loop over the spin systems j.
-                for j in range(self.num_spins):
-                    # Calculate the average PCS.
-                    if not self.missing_deltaij[align_index, j]:
-                        self.deltaij_theta[align_index, j] = ave_pcs_tensor(self.pcs_const[align_index, j], self.paramag_unit_vect[j], self.N, self.A[align_index], weights=self.probs)
+                # The mu_jc . Ai . mu_jc projections for all spin systems j and states c.
+                proj = (dot(self.paramag_unit_vect, self.A[align_index]) * self.paramag_unit_vect).sum(axis=2)
+
+                # Calculate the average PCS for all spin systems at once, skipping the missing data.
+                mask = self.missing_deltaij[align_index] == 0
+                self.deltaij_theta[align_index, mask] = dot(self.pcs_const[align_index] * proj, weights)[mask]
 
             # Calculate and sum the single alignment chi-squared value (for the RDC).
             if self.rdc_flag[align_index]:
@@ -22,6 +22,9 @@
 # Module docstring.
 """Functions for calculating various optimisation potentials."""
 
+# Python module imports.
+from numpy import multiply, square, subtract
+
 
 def quad_pot(values, pot, lower, upper):
     """Calculate the flat-bottom quadratic energy potential.
@@ -50,16 +53,12 @@ def quad_pot(values, pot, lower, upper):
     @type upper:    numpy float array
     """
 
-    # Loop over the x values.
-    for i in range(len(values)):
-        # First condition.
-        if values[i] > upper[i]:
-            pot[i] = (values[i] - upper[i])**2
-
-        # Second contition.
-        elif values[i] < lower[i]:
-            pot[i] = (values[i] - lower[i])**2
+    # Second condition, otherwise clear the array elements (operating in-place on the pot array).
+    subtract(values, lower, pot)
+    multiply(pot, values < lower, pot)
+    square(pot, pot)
 
-        # Otherwise clear the array element.
-        else:
-            pot[i] = 0.0
+    # First condition (this takes precedence over the second).
+    diff = values - upper
+    mask = diff > 0.0
+    pot[mask] = diff[mask]**2
@@ -20,8 +20,8 @@
 ###############################################################################
 
 # relax module imports.
-from pipe_control import align_tensor
-from lib.errors import RelaxStrError, RelaxUnknownParamError
+from pipe_control import align_tensor, pipes
+from lib.errors import RelaxStrError, RelaxUnknownParamCombError, RelaxUnknownParamError
 from test_suite.unit_tests.align_tensor_testing_base import Align_tensor_base_class
 
 
@@ -31,6 +31,44 @@ class Test_align_tensor(Align_tensor_base_class):
     # Place the pipe_control.align_tensor module into the class namespace.
     align_tensor_fns = align_tensor
 
+    def test_set_batch(self):
+        """Test the setting of the 5 geometric parameters in one step.
+
+        The function tested is pipe_control.align_tensor.set_batch().
+        """
+
+        # Get the data pipe.
+        dp = pipes.get_pipe('orig')
+
+        # Initialise the tensor.
+        self.align_tensor_fns.init(tensor='Pf1', align_id='Pf1', params=(-16.6278, 6.13037, 7.65639, -1.89157, 19.2561), scale=1.0, angle_units='rad', param_types=0)
+        tensor = dp.align_tensors[0]
+
+        # Set the tensor using the geometric basis set (in a non-standard order).
+        self.align_tensor_fns.set_batch(tensor=tensor, params=['Sxy', 'Szz', 'Sxz', 'Sxxyy', 'Syz'], values=[1.0, 2.0, 3.0, 4.0, 5.0])
+
+        # Test the tensor.
+        self.assertAlmostEqual(tensor.Szz, 2.0)
+        self.assertAlmostEqual(tensor.Sxxyy, 4.0)
+        self.assertAlmostEqual(tensor.Sxy, 1.0)
+        self.assertAlmostEqual(tensor.Sxz, 3.0)
+        self.assertAlmostEqual(tensor.Syz, 5.0)
+
+        # Set the errors using the probability tensor.
+        self.align_tensor_fns.set_batch(tensor=tensor, params=['Pxx', 'Pyy', 'Pxy', 'Pxz', 'Pyz'], values=[1.0, 0.5, 0.1, 0.2, 0.3], errors=True)
+
+        # Test the errors.
+        self.assertAlmostEqual(tensor.Axx_err, 2.0/3.0)
+        self.assertAlmostEqual(tensor.Ayy_err, 1.0/6.0)
+        self.assertAlmostEqual(tensor.Axy_err, 0.1)
+        self.assertAlmostEqual(tensor.Axz_err, 0.2)
+        self.assertAlmostEqual(tensor.Ayz_err, 0.3)
+
+        # Unknown parameter sets.
+        self.assertRaises(RelaxUnknownParamCombError, self.align_tensor_fns.set_batch, tensor=tensor, params=['Sxx', 'Ayy', 'Sxy', 'Sxz', 'Syz'], values=[1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertRaises(RelaxUnknownParamCombError, self.align_tensor_fns.set_batch, tensor=tensor, params=['Sxx', 'Syy', 'Sxy', 'Sxz'], values=[1.0, 2.0, 3.0, 4.0])
+
+
     def test_return_data_name(self):
         """The returning of alignment tensor parameter names.
 
@@ -0,0 +1,103 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2026 agent                                                    #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+
+# Python module imports.
+from numpy import array, float64
+from unittest import TestCase
+
+# relax module imports.
+from specific_analyses.api_common import API_common
+
+
+class Test_api_common(TestCase):
+    """Unit tests for the specific_analyses.api_common module."""
+
+    def setUp(self):
+        """Set up for all the API_common unit tests."""
+
+        # The API_common object.
+        self.api = API_common()
+
+
+    def test_copy_select_sim(self):
+        """Test the API_common._copy_select_sim() method."""
+
+        # List and array flags.
+        flags = [True, False, True]
+        flags_array = array(flags)
+
+        # The copies.
+        copy = self.api._copy_select_sim(flags)
+        copy_array = self.api._copy_select_sim(flags_array)
+
+        # Check the list copy.
+        self.assertEqual(copy, flags)
+        self.assert_(copy is not flags)
+
+        # Check the array copy.
+        self.assertEqual(list(copy_array), flags)
+        self.assert_(copy_array is not flags_array)
+
+
+    def test_sim_copies_immutable(self):
+        """Test the API_common._sim_copies() method for immutable values."""
+
+        # Loop over a float, string and None value.
+        for value in [1.5, 'test', None]:
+            # The copies.
+            copies = self.api._sim_copies(value, 3)
+
+            # Checks.
+            self.assertEqual(len(copies), 3)
+            for i in range(3):
+                self.assertEqual(copies[i], value)
+
+
+    def test_sim_copies_mutable(self):
+        """Test that the API_common._sim_copies() method returns independent copies of mutable values."""
+
+        # Flat, nested and array values.
+        values = [
+            [1.0, 2.0],
+            {'a': 1.0, 'b': None},
+            [[1.0, 2.0], [3.0]],
+            {'a': [1.0]},
+            array([1.0, 2.0], float64)
+        ]
+
+        # Loop over the values.
+        for value in values:
+            # The copies.
+            copies = self.api._sim_copies(value, 2)
+
+            # The number of copies.
+            self.assertEqual(len(copies), 2)
+
+            # The copies must be new objects.
+            self.assert_(copies[0] is not value)
+            self.assert_(copies[0] is not copies[1])
+
+        # The nested objects must also be copied.
+        copies = self.api._sim_copies(values[2], 2)
+        copies[0][0].append(5.0)
+        self.assertEqual(values[2][0], [1.0, 2.0])
+        self.assertEqual(copies[1][0], [1.0, 2.0])
@@ -24,7 +24,9 @@ from math import pi
 from unittest import TestCase
 
 # relax module imports.
-from specific_analyses.n_state_model import parameters
+from pipe_control.mol_res_spin import create_spin, return_spin, spin_loop
+from specific_analyses.n_state_model import N_state_model, parameters
+from specific_analyses.n_state_model.data import calc_ave_dist, calc_ave_dists
 from test_suite.unit_tests.n_state_model_testing_base import N_state_model_base_class
 
 
@@ -61,6 +63,79 @@ class Test_n_state_model(N_state_model_base_class, TestCase):
             self.assertEqual(param_vector[i], vector_true[i])
 
 
+    def test_base_data_loop(self):
+        """Test that the Monte Carlo back-calculation flag of the N-state model base_data_loop() method does not outlive the loop."""
+
+        # Set up a spin with PCS data.
+        create_spin(spin_num=1, spin_name='N', res_num=1, res_name='ALA')
+        return_spin(':1').pcs = {'tb': 1.0}
+        cdp.pcs_ids = ['tb']
+
+        # The analysis instance.
+        api = N_state_model()
+
+        # Flag the back-calculation part way through a completed loop.
+        loop = api.base_data_loop()
+        self.assertEqual(next(loop)[1:], ('pcs', 'tb'))
+        api._mc_bc_done = True
+        self.assertEqual(list(loop), [])
+        self.assertEqual(api._mc_bc_done, False)
+
+        # Flag the back-calculation part way through an abandoned loop.
+        loop = api.base_data_loop()
+        next(loop)
+        api._mc_bc_done = True
+        loop.close()
+        self.assertEqual(api._mc_bc_done, False)
+
+
+    def test_calc_ave_dist(self):
+        """Test the operation of the specific_analyses.n_state_model.data.calc_ave_dist() function for single and multiple model positions."""
+
+        # Create the spins.
+        for i in range(1, 4):
+            create_spin(spin_num=i, spin_name='H', res_num=i, res_name='ALA')
+
+        # Single and multiple model positions.
+        return_spin(':1').pos = [1.0, 2.0, 3.0]
+        return_spin(':2').pos = [4.0, 6.0, 3.0]
+        return_spin(':3').pos = [[1.0, 2.0, 4.0], [1.0, 2.0, 5.0]]
+
+        # Check the averages.
+        self.assertAlmostEqual(calc_ave_dist(':1', ':2'), 5.0)
+        self.assertAlmostEqual(calc_ave_dist(':1', ':2', exp=-6), 5.0)
+        self.assertAlmostEqual(calc_ave_dist(':1', ':3'), 1.5)
+        self.assertAlmostEqual(calc_ave_dist(':1', ':3', exp=-6), ((1.0 + 2.0**-6) / 2.0)**(-1.0/6.0))
+
+
+    def test_calc_ave_dists(self):
+        """Test the operation of the specific_analyses.n_state_model.data.calc_ave_dists() function for single and multiple model positions."""
+
+        # Create the spins.
+        for i in range(1, 5):
+            create_spin(spin_num=i, spin_name='H', res_num=i, res_name='ALA')
+
+        # Single positions (as loaded with averaged positions).
+        return_spin(':1').pos = [1.0, 2.0, 3.0]
+        return_spin(':2').pos = [4.0, 6.0, 3.0]
+
+        # Multiple model positions.
+        return_spin(':3').pos = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+        return_spin(':4').pos = [[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]
+
+        # Linear averaging (the single positions are used for all models in the mixed pair).
+        dist = calc_ave_dists([':1', ':3', ':2'], [':2', ':4', ':4'], exp=1)
+        self.assertEqual(len(dist), 3)
+        self.assertAlmostEqual(dist[0], 5.0)
+        self.assertAlmostEqual(dist[1], 1.5)
+        self.assertAlmostEqual(dist[2], (54**0.5 + 7.0) / 2.0)
+
+        # r^-6 averaging.
+        dist = calc_ave_dists([':1', ':3'], [':2', ':4'], exp=-6)
+        self.assertAlmostEqual(dist[0], 5.0)
+        self.assertAlmostEqual(dist[1], ((1.0 + 2.0**-6) / 2.0)**(-1.0/6.0))
+
+
     def test_disassemble_param_vector(self):
         """Test the operation of the specific_analyses.n_state_model.parameters.disassemble_param_vector() method."""
 
@@ -83,3 +158,25 @@ class Test_n_state_model(N_state_model_base_class, TestCase):
         self.assertEqual(cdp.alpha, [0.0, pi/2, pi])
         self.assertEqual(cdp.beta, [pi/2, pi, 3*pi/2])
         self.assertEqual(cdp.gamma, [1.0, 3*pi/2, 2*pi])
+
+
+    def test_set_param_values(self):
+        """Test that the specific_analyses.n_state_model.N_state_model.set_param_values() method only sets the model parameters on the data pipe."""
+
+        # Set up the N, probabilities and Euler angles, and a spin.
+        cdp.N = 2
+        cdp.probs = [None]*2
+        cdp.alpha = [None]*2
+        create_spin(spin_num=1, spin_name='N', res_num=1, res_name='ALA')
+
+        # Set the parameters.
+        N_state_model().set_param_values(param=['p0', 'alpha0'], value=[0.3, 1.0])
+
+        # Check the data pipe values.
+        self.assertEqual(cdp.probs, [0.3, None])
+        self.assertEqual(cdp.alpha, [1.0, None])
+
+        # The parameters must not be copied onto the spin containers.
+        for spin in spin_loop():
+            self.assert_(not hasattr(spin, 'probs'))
+            self.assert_(not hasattr(spin, 'alpha'))
@@ -0,0 +1,57 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2026 agent                                                    #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+
+# Python module imports.
+from unittest import TestCase
+
+# relax module imports.
+from lib.physical_constants import N15_CSA, NH_BOND_LENGTH, h_bar, mu0, return_gyromagnetic_ratio
+from target_functions.consistency_tests import Consistency
+
+
+class Test_consistency_tests(TestCase):
+    """Unit tests for the target_functions.consistency_tests relax module."""
+
+    def test_func_vect(self):
+        """Check that the vectorised Consistency.func_vect() method matches the func() method."""
+
+        # The target function object.
+        ct = Consistency(frq=600e6, gx=return_gyromagnetic_ratio('15N'), gh=return_gyromagnetic_ratio('1H'), mu0=mu0, h_bar=h_bar)
+
+        # The data for three spins.
+        orientation = [15.7, 15.7, 20.0]
+        tc = [13e-9, 10e-9, 8e-9]
+        r = [NH_BOND_LENGTH, NH_BOND_LENGTH, 1.04e-10]
+        csa = [N15_CSA, N15_CSA, -160e-6]
+        r1 = [1.2, 1.5, 0.9]
+        r2 = [15.0, 12.0, 9.0]
+        noe = [0.8, 0.7, 0.6]
+
+        # The vectorised values.
+        j0, f_eta, f_r2 = ct.func_vect(orientation=orientation, tc=tc, r=r, csa=csa, r1=r1, r2=r2, noe=noe)
+
+        # Compare to the individual calculations.
+        for i in range(3):
+            values = ct.func(orientation=orientation[i], tc=tc[i], r=r[i], csa=csa[i], r1=r1[i], r2=r2[i], noe=noe[i])
+            self.assertAlmostEqual(j0[i] / values[0], 1.0)
+            self.assertAlmostEqual(f_eta[i] / values[1], 1.0)
+            self.assertAlmostEqual(f_r2[i] / values[2], 1.0)
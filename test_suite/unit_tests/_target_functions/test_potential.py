@@ -0,0 +1,63 @@
+###############################################################################
+#                                                                             #
+# Copyright (C) 2026 agent                                                    #
+#                                                                             #
+# This file is part of the program relax (http://www.nmr-relax.com).          #
+#                                                                             #
+# This program is free software: you can redistribute it and/or modify        #
+# it under the terms of the GNU General Public License as published by        #
+# the Free Software Foundation, either version 3 of the License, or           #
+# (at your option) any later version.                                         #
+#                                                                             #
+# This program is distributed in the hope that it will be useful,             #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of              #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+# GNU General Public License for more details.                                #
+#                                                                             #
+# You should have received a copy of the GNU General Public License           #
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.       #
+#                                                                             #
+###############################################################################
+
+
+# Python module imports.
+from numpy import array, float64, zeros
+from unittest import TestCase
+
+# relax module imports.
+from target_functions.potential import quad_pot
+
+
+class Test_potential(TestCase):
+    """Unit tests for the target_functions.potential relax module."""
+
+    def test_quad_pot(self):
+        """Unit test 1 of the quad_pot() function."""
+
+        # The data.
+        values = array([1.0, 2.5, 4.0, 6.0, 2.0], float64)
+        lower = array([2.0, 2.0, 2.0, 2.0, 2.0], float64)
+        upper = array([5.0, 5.0, 5.0, 5.0, 5.0], float64)
+        pot = zeros(5, float64)
+
+        # Calculate the potential.
+        quad_pot(values, pot, lower, upper)
+
+        # Check the values.
+        self.assertEqual(list(pot), [1.0, 0.0, 0.0, 1.0, 0.0])
+
+
+    def test_quad_pot2(self):
+        """Unit test 2 of the quad_pot() function, checking that the array is cleared."""
+
+        # The data.
+        values = array([3.0, 0.0, 7.5], float64)
+        lower = array([2.0, 1.5, 2.0], float64)
+        upper = array([5.0, 5.0, 6.0], float64)
+        pot = array([10.0, 10.0, 10.0], float64)
+
+        # Calculate the potential.
+        quad_pot(values, pot, lower, upper)
+
+        # Check the values.
+        self.assertEqual(list(pot), [0.0, 2.25, 2.25])